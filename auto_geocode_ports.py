@@ -11,26 +11,57 @@ Usage:
     python3 auto_geocode_ports.py --dry-run    # Preview what will be found
     python3 auto_geocode_ports.py              # Actually update scraper.py
     python3 auto_geocode_ports.py --merge      # Only geocode missing ports, keep existing
+    python3 auto_geocode_ports.py --refresh    # Ignore cached lookups and re-query Nominatim
 """
 
-import json
+import ast
+import heapq
+import io
 import time
 import re
 import random
-from typing import Dict, Optional, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError
-from urllib.parse import quote
+import sqlite3
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, Tuple
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from coordinates_source import find_coordinates_block
+from json_helpers import json_loads
+
 # Rate limiting - Nominatim ToS: no more than 1 request/second.
 # Use 1.5s base + random jitter to stay safely within limits.
 DELAY_BETWEEN_REQUESTS = 1.5
-DELAY_JITTER = 0.5  # actual sleep = DELAY_BETWEEN_REQUESTS + random.uniform(-JITTER, +JITTER)
+DELAY_JITTER = 0.5  # actual gap = DELAY_BETWEEN_REQUESTS + random.uniform(-JITTER, +JITTER)
+
+# time.monotonic() of the last request sent to Nominatim (see wait_for_rate_limit)
+_last_request_at = 0.0
 
 # User agent is required by Nominatim
 USER_AGENT = "USCG-Port-Status-Monitor/1.0"
 
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+# Restrict matches server-side to the US and its territories (OSM tags them separately)
+NOMINATIM_COUNTRY_CODES = "us,pr,vi,gu,as,mp"
+REQUEST_TIMEOUT_SECS = 15
+
+# One keep-alive session for every lookup, so we pay the TLS handshake once.
+# The adapter itself never retries: retries happen in geocode_location, so
+# they go through wait_for_rate_limit() like every other request.
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0))
+
+# Transient failures (incl. Nominatim's 429 + Retry-After) are retried instead
+# of surfacing as misses
+MAX_RETRIES = 3
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Local cache of Nominatim answers so re-runs don't hit the network again
+GEOCODE_CACHE_PATH = "geocode_cache.db"
+
 # State/territory mapping for better geocoding
 STATE_TERRITORY_MAP = {
     'AL': 'Alabama', 'AK': 'Alaska', 'AZ': 'Arizona', 'AR': 'Arkansas',
@@ -58,14 +89,98 @@ NAUTICAL_ABBREVIATIONS = {
     'USCG': 'US Coast Guard',
 }
 
+# Common replacements for better results (longer prefixes first)
+NAME_REPLACEMENTS = {
+    'ST CROIX': 'Saint Croix',
+    'ST THOMAS': 'Saint Thomas',
+    'ST JOHN': 'Saint John',
+    'ST ': 'Saint ',
+    'MT ': 'Mount ',
+    'PT ': 'Point ',
+    'FT ': 'Fort ',
+}
+
+# Precompiled once instead of on every port
+_STATE_CODE_BY_NAME = {name.upper(): code for code, name in STATE_TERRITORY_MAP.items()}
+# Longest names first so "WEST VIRGINIA" wins over "VIRGINIA", "ARKANSAS" over "KANSAS"
+_STATE_NAME_RE = re.compile('|'.join(
+    re.escape(name) for name in sorted(_STATE_CODE_BY_NAME, key=len, reverse=True)
+))
+_STATE_AT_END_RE = re.compile(r',\s*([A-Z]{2})$')
+_STATE_AT_START_RE = re.compile(r'^([A-Z]{2}),\s*(.+)$')
+_ABBREVIATION_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, NAUTICAL_ABBREVIATIONS)) + r')\b'
+)
+# Replacements only apply at the start of the name or after a space
+_REPLACEMENT_RE = re.compile(
+    r'(?:^|(?<= ))(' + '|'.join(map(re.escape, NAME_REPLACEMENTS)) + r')'
+)
+
+
+class GeocodeCache:
+    """
+    SQLite cache of Nominatim lookups, keyed by normalized query string.
+    Usage:  with GeocodeCache() as cache: ...
+
+    Misses ("not found") are cached too, so ports that never geocode aren't
+    retried on every run. Network errors are never cached.
+    """
+
+    def __init__(self, db_path: str = None, refresh: bool = False):
+        self.db_path = db_path or GEOCODE_CACHE_PATH
+        self.refresh = refresh          # True = ignore cached answers (still writes)
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self):
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocode_cache (
+                query      TEXT PRIMARY KEY,
+                lat        REAL,
+                lon        REAL,
+                status     TEXT NOT NULL,
+                fetched_at TEXT DEFAULT (datetime('now', 'utc'))
+            )
+        """)
+        self.conn.commit()
+        return self
+
+    def __exit__(self, *args):
+        if self.conn:
+            self.conn.commit()
+            self.conn.close()
+
+    @staticmethod
+    def _key(search_query: str) -> str:
+        return " ".join(search_query.split()).lower()
+
+    def lookup(self, search_query: str) -> Optional[sqlite3.Row]:
+        """Cached row for this query, or None if we have to ask Nominatim."""
+        if self.refresh:
+            return None
+        return self.conn.execute(
+            "SELECT lat, lon, status FROM geocode_cache WHERE query=?",
+            (self._key(search_query),)
+        ).fetchone()
+
+    def store(self, search_query: str, coords: Optional[Tuple[float, float]]):
+        """Remember a Nominatim answer (coords, or None for 'not found')."""
+        lat, lon = coords if coords else (None, None)
+        self.conn.execute("""
+            INSERT OR REPLACE INTO geocode_cache (query, lat, lon, status)
+            VALUES (?, ?, ?, ?)
+        """, (self._key(search_query), lat, lon, "hit" if coords else "miss"))
+
 
 def load_ports_from_geojson() -> list:
     """Load all unique sub-ports from the current GeoJSON."""
     print("📖 Loading ports from api/ports.geojson...")
     
     try:
-        with open('api/ports.geojson', 'r') as f:
-            data = json.load(f)
+        with open('api/ports.geojson', 'rb') as f:
+            # Only the feature list is needed; don't keep the wrapper around
+            features = json_loads(f.read())['features']
     except FileNotFoundError:
         print("❌ Error: api/ports.geojson not found!")
         print("   Make sure you're running this from your project root folder.")
@@ -74,10 +189,11 @@ def load_ports_from_geojson() -> list:
     ports = []
     seen = set()
     
-    for feature in data['features']:
-        if feature['properties'].get('type') == 'sub_port':
-            zone = feature['properties'].get('zone_name', '')
-            port = feature['properties']['name']
+    for feature in features:
+        props = feature['properties']
+        if props.get('type') == 'sub_port':
+            zone = props.get('zone_name', '')
+            port = props['name']
             
             # Create unique key
             key = (zone, port)
@@ -104,7 +220,7 @@ def extract_state_from_port_name(port_name: str) -> Tuple[str, Optional[str]]:
         "MIAMI" -> ("MIAMI", None)
     """
     # Pattern 1: State at end like "CHICAGO, IL"
-    match = re.search(r',\s*([A-Z]{2})$', port_name)
+    match = _STATE_AT_END_RE.search(port_name)
     if match:
         state_code = match.group(1)
         if state_code in STATE_TERRITORY_MAP:
@@ -112,7 +228,7 @@ def extract_state_from_port_name(port_name: str) -> Tuple[str, Optional[str]]:
             return (cleaned, state_code)
     
     # Pattern 2: State at start like "PR, SAN JUAN" or "VI, ST THOMAS"
-    match = re.match(r'^([A-Z]{2}),\s*(.+)$', port_name)
+    match = _STATE_AT_START_RE.match(port_name)
     if match:
         state_code = match.group(1)
         if state_code in STATE_TERRITORY_MAP:
@@ -125,6 +241,7 @@ def extract_state_from_port_name(port_name: str) -> Tuple[str, Optional[str]]:
     return (port_name, None)
 
 
+@lru_cache(maxsize=1024)
 def clean_port_name(port_name: str, zone_name: str) -> Tuple[str, Optional[str]]:
     """
     Clean up port name and extract state for better geocoding results.
@@ -135,135 +252,177 @@ def clean_port_name(port_name: str, zone_name: str) -> Tuple[str, Optional[str]]
     
     # If no state found in port name, try to infer from zone
     if not state_code:
-        for code, full_name in STATE_TERRITORY_MAP.items():
-            if full_name.upper() in zone_name.upper():
-                state_code = code
-                break
+        match = _STATE_NAME_RE.search(zone_name.upper())
+        if match:
+            state_code = _STATE_CODE_BY_NAME[match.group(0)]
     
-    # Expand abbreviations
-    for abbr, expansion in NAUTICAL_ABBREVIATIONS.items():
-        # Match whole word only
-        name = re.sub(r'\b' + abbr + r'\b', expansion, name)
+    # Expand abbreviations (whole words only)
+    name = _ABBREVIATION_RE.sub(lambda m: NAUTICAL_ABBREVIATIONS[m.group(1)], name)
     
     # Common replacements for better results
-    replacements = {
-        'ST CROIX': 'Saint Croix',
-        'ST THOMAS': 'Saint Thomas',
-        'ST JOHN': 'Saint John',
-        'ST ': 'Saint ',
-        'MT ': 'Mount ',
-        'PT ': 'Point ',
-        'FT ': 'Fort ',
-    }
-    
-    for old, new in replacements.items():
-        if name.startswith(old):
-            name = new + name[len(old):]
-        else:
-            name = name.replace(' ' + old, ' ' + new)
+    name = _REPLACEMENT_RE.sub(lambda m: NAME_REPLACEMENTS[m.group(1)], name)
     
     return (name.strip(), state_code)
 
 
-def build_search_query(port_name: str, zone_name: str) -> list:
+def build_search_queries(port_name: str, zone_name: str) -> Iterator[str]:
     """
-    Build multiple search queries to try, in order of specificity.
+    Yield search queries to try, in order of specificity.
     This helps us find the port even if the exact name doesn't match.
+    Lazy, so fallbacks are only built when the earlier queries missed.
     """
     clean_name, state_code = clean_port_name(port_name, zone_name)
-    
-    queries = []
     state_name = STATE_TERRITORY_MAP.get(state_code, '') if state_code else ''
     
+    # Drop repeats (Nominatim is case-insensitive) so no request is wasted
+    seen = set()
+    for query in _candidate_queries(clean_name, state_name):
+        key = query.lower()
+        if key not in seen:
+            seen.add(key)
+            yield query
+
+
+def _candidate_queries(clean_name: str, state_name: str) -> Iterator[str]:
+    """Raw query candidates for build_search_queries (may contain repeats)."""
     # If we have a state, use it prominently
     if state_name:
         # Try 1: Port name with state
         if not clean_name.lower().startswith('port'):
-            queries.append(f"Port of {clean_name}, {state_name}, United States")
-        queries.append(f"{clean_name}, {state_name}, United States")
+            yield f"Port of {clean_name}, {state_name}, United States"
+        yield f"{clean_name}, {state_name}, United States"
         
         # Try 2: With harbor
         if 'harbor' not in clean_name.lower() and 'harbour' not in clean_name.lower():
-            queries.append(f"{clean_name} Harbor, {state_name}, United States")
+            yield f"{clean_name} Harbor, {state_name}, United States"
         
         # Try 3: Just city and state (for ports named after cities)
         if '-' in clean_name:
             main_city = clean_name.split('-')[0].strip()
-            queries.append(f"{main_city}, {state_name}, United States")
+            yield f"{main_city}, {state_name}, United States"
     else:
         # No state - use generic searches (less accurate)
         # Try 1: Port name with "Port" prefix
         if not clean_name.lower().startswith('port'):
-            queries.append(f"Port of {clean_name}, United States")
+            yield f"Port of {clean_name}, United States"
         
         # Try 2: Exact name
-        queries.append(f"{clean_name}, United States")
+        yield f"{clean_name}, United States"
         
         # Try 3: Just the main city name (for ports like "HOUSTON-GALVESTON")
         if '-' in clean_name:
             main_city = clean_name.split('-')[0].strip()
-            queries.append(f"Port of {main_city}, United States")
+            yield f"Port of {main_city}, United States"
         
         # Try 4: Add "harbor" or "harbor entrance"
         if 'harbor' not in clean_name.lower():
-            queries.append(f"{clean_name} Harbor, United States")
-    
-    return queries
+            yield f"{clean_name} Harbor, United States"
+
+
+def wait_for_rate_limit():
+    """
+    Block until enough time has passed since the previous Nominatim request.
+    Only the remaining part of the gap is slept, so time already spent on the
+    last round-trip (and on cache hits in between) counts toward the delay.
+    """
+    global _last_request_at
+    gap = DELAY_BETWEEN_REQUESTS + random.uniform(-DELAY_JITTER, DELAY_JITTER)
+    remaining = _last_request_at + gap - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    _last_request_at = time.monotonic()
+
+
+def retry_delay(attempt: int, response: Optional[requests.Response]) -> float:
+    """
+    Backoff before retry number `attempt` (1-based): DELAY_BETWEEN_REQUESTS,
+    doubling each time, and never shorter than the server's Retry-After.
+    """
+    delay = DELAY_BETWEEN_REQUESTS * 2 ** (attempt - 1)
+    if response is not None:
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+    return delay
 
 
-def geocode_location(search_query: str) -> Optional[Tuple[float, float]]:
+def geocode_location(search_query: str, cache: GeocodeCache = None) -> Optional[Tuple[float, float]]:
     """
     Use Nominatim (OpenStreetMap) to find coordinates for a location.
     Returns (latitude, longitude) or None if not found.
+    If a cache is given, answers are served from / saved to it.
     """
-    encoded_query = quote(search_query)
-    url = f"https://nominatim.openstreetmap.org/search?q={encoded_query}&format=json&limit=1"
+    if cache is not None:
+        row = cache.lookup(search_query)
+        if row is not None:
+            return (row["lat"], row["lon"]) if row["status"] == "hit" else None
+
+    params = {
+        'q': search_query,
+        'countrycodes': NOMINATIM_COUNTRY_CODES,
+        'format': 'json',
+        'limit': 1,
+    }
+    
+    response, error = None, None
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            time.sleep(retry_delay(attempt, response))
+        wait_for_rate_limit()
+        try:
+            response = SESSION.get(NOMINATIM_URL, params=params, timeout=REQUEST_TIMEOUT_SECS)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            response, error = None, e
+            continue
+        if response.status_code not in RETRYABLE_STATUS_CODES:
+            break
+        error = f"HTTP {response.status_code}"
+    else:
+        print(f"   ⚠️  Nominatim still failing after {MAX_RETRIES} retries: {error}")
+        return None
     
     try:
-        req = Request(url, headers={'User-Agent': USER_AGENT})
-        response = urlopen(req, timeout=10)
-        data = json.loads(response.read().decode())
+        response.raise_for_status()
+        data = json_loads(response.content)
         
+        coords = None
         if data and len(data) > 0:
             lat = float(data[0]['lat'])
             lon = float(data[0]['lon'])
-            return (lat, lon)
+            coords = (lat, lon)
         
-        return None
+        if cache is not None:
+            cache.store(search_query, coords)
+        return coords
     
-    except URLError as e:
-        print(f"   ⚠️  Network error contacting Nominatim: {e}")
-        return None
-    except TimeoutError as e:
-        print(f"   ⚠️  Nominatim request timed out: {e}")
-        return None
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
+    except (KeyError, ValueError) as e:
+        # ValueError also covers a body that isn't valid JSON
         print(f"   ⚠️  Unexpected Nominatim response format: {e}")
         return None
+    except requests.exceptions.RequestException as e:
+        print(f"   ⚠️  Network error contacting Nominatim: {e}")
+        return None
     except Exception as e:
         print(f"   ⚠️  Geocoding error (unexpected): {e}")
         return None
 
 
-def geocode_port(port: dict) -> Optional[Tuple[float, float]]:
+def geocode_port(port: dict, cache: GeocodeCache = None) -> Optional[Tuple[float, float]]:
     """
     Try multiple queries to geocode a port.
     Returns (latitude, longitude) or None.
     """
-    queries = build_search_query(port['name'], port['zone'])
+    queries = build_search_queries(port['name'], port['zone'])
     
     for i, query in enumerate(queries):
         if i > 0:
             # Only show trying message for fallback attempts
             print(f"   🔄 Trying alternate query: \"{query}\"")
         
-        coords = geocode_location(query)
+        coords = geocode_location(query, cache)
         
         if coords:
             return coords
-
-        # Rate limiting with jitter to stay within Nominatim ToS
-        time.sleep(DELAY_BETWEEN_REQUESTS + random.uniform(-DELAY_JITTER, DELAY_JITTER))
     
     return None
 
@@ -277,27 +436,14 @@ def load_existing_coordinates() -> Dict[str, dict]:
         with open('scraper.py', 'r') as f:
             content = f.read()
         
-        # Find PORT_COORDINATES dictionary
-        pattern = r'PORT_COORDINATES\s*=\s*\{([^}]+)\}'
-        match = re.search(pattern, content, re.DOTALL)
-        
-        if not match:
+        span = find_coordinates_block(content)
+        if not span:
             return {}
         
-        # Parse the dictionary manually (safer than eval)
-        coords_text = match.group(1)
-        coordinates = {}
-        
-        # Match each line like: "PORT NAME": {"lat": 25.7617, "lon": -80.1918}
-        line_pattern = r'"([^"]+)":\s*\{\s*"lat":\s*([-\d.]+),\s*"lon":\s*([-\d.]+)'
-        
-        for match in re.finditer(line_pattern, coords_text):
-            port_name = match.group(1)
-            lat = float(match.group(2))
-            lon = float(match.group(3))
-            coordinates[port_name] = {"lat": lat, "lon": lon}
-        
-        return coordinates
+        # Parse the dict literal directly (safe - literals only, no eval)
+        start, end = span
+        literal = content[start:end].split('=', 1)[1]
+        return ast.literal_eval(literal.strip())
     
     except FileNotFoundError:
         return {}
@@ -306,7 +452,8 @@ def load_existing_coordinates() -> Dict[str, dict]:
         return {}
 
 
-def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict = None) -> Dict[str, dict]:
+def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict = None,
+                      cache: GeocodeCache = None) -> Dict[str, dict]:
     """
     Geocode all ports and return a dictionary ready for PORT_COORDINATES.
     
@@ -314,6 +461,7 @@ def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict
         ports: List of port dictionaries
         dry_run: If True, don't modify files
         existing_coords: Existing coordinates to preserve (for merge mode)
+        cache: Optional GeocodeCache for previously looked-up queries
     
     Returns:
         Dict like: {"PORT NAME": {"lat": 25.7617, "lon": -80.1918}}
@@ -340,12 +488,15 @@ def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict
     # Create log file
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_filename = f"geocoding_log_{timestamp}.txt"
-    log_file = open(log_filename, 'w')
-    
-    log_file.write("=" * 70 + "\n")
-    log_file.write("USCG PORT GEOCODING LOG\n")
-    log_file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    log_file.write("=" * 70 + "\n\n")
+    # Big buffer: the log is only read after the run, so let writes pile up
+    log_file = open(log_filename, 'w', buffering=1 << 16)
+    
+    log_file.write(
+        "=" * 70 + "\n"
+        "USCG PORT GEOCODING LOG\n"
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        + "=" * 70 + "\n\n"
+    )
     
     total = len(ports)
     
@@ -360,19 +511,19 @@ def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict
                 continue
         
         print(f"[{idx}/{total}] 🔍 Geocoding: {port_name} ({zone_name})")
-        log_file.write(f"[{idx}/{total}] Port: {port_name} (Zone: {zone_name})\n")
         
-        coords = geocode_port(port)
+        coords = geocode_port(port, cache)
         
+        # One console write + one log write per port
         if coords:
             lat, lon = coords
             coordinates[port_name] = {"lat": lat, "lon": lon}
-            print(f"   ✅ Found: {lat:.4f}, {lon:.4f}")
-            log_file.write(f"   ✅ SUCCESS: {lat:.6f}, {lon:.6f}\n")
+            print(f"   ✅ Found: {lat:.4f}, {lon:.4f}\n")
+            result_line = f"   ✅ SUCCESS: {lat:.6f}, {lon:.6f}"
             successful += 1
         else:
-            print(f"   ❌ Could not find coordinates")
-            log_file.write(f"   ❌ FAILED: No coordinates found\n")
+            print("   ❌ Could not find coordinates\n")
+            result_line = "   ❌ FAILED: No coordinates found"
             failed.append({
                 'name': port_name,
                 'zone': zone_name
@@ -386,8 +537,7 @@ def geocode_all_ports(ports: list, dry_run: bool = False, existing_coords: Dict
                 "needs_manual_fix": True
             }
         
-        log_file.write("\n")
-        print()
+        log_file.write(f"[{idx}/{total}] Port: {port_name} (Zone: {zone_name})\n{result_line}\n\n")
     
     # Write summary to log
     log_file.write("\n" + "=" * 70 + "\n")
@@ -450,7 +600,7 @@ def update_scraper_file(coordinates: Dict[str, dict], dry_run: bool = False):
         print("=" * 70)
         print()
         print("PORT_COORDINATES = {")
-        for port_name in sorted(list(coordinates.keys())[:10]):  # Show first 10
+        for port_name in heapq.nsmallest(10, coordinates):  # First 10 alphabetically
             coord = coordinates[port_name]
             print(f'    "{port_name}": {{"lat": {coord["lat"]:.4f}, "lon": {coord["lon"]:.4f}}},')
         if len(coordinates) > 10:
@@ -473,20 +623,22 @@ def update_scraper_file(coordinates: Dict[str, dict], dry_run: bool = False):
         return
     
     # Build the new PORT_COORDINATES dictionary
-    coord_lines = ["PORT_COORDINATES = {"]
-    for port_name in sorted(coordinates.keys()):
+    buf = io.StringIO()
+    buf.write("PORT_COORDINATES = {\n")
+    for port_name in sorted(coordinates):
         coord = coordinates[port_name]
-        coord_lines.append(f'    "{port_name}": {{"lat": {coord["lat"]:.6f}, "lon": {coord["lon"]:.6f}}},')
-    coord_lines.append("}")
+        buf.write(f'    "{port_name}": {{"lat": {coord["lat"]:.6f}, "lon": {coord["lon"]:.6f}}},\n')
+    buf.write("}")
     
-    new_coords_section = "\n".join(coord_lines)
+    new_coords_section = buf.getvalue()
     
     # Find and replace the PORT_COORDINATES dictionary
-    pattern = r'PORT_COORDINATES\s*=\s*\{[^}]*\}'
+    span = find_coordinates_block(content)
     
-    if re.search(pattern, content):
+    if span:
         # Replace existing
-        updated_content = re.sub(pattern, new_coords_section, content, flags=re.DOTALL)
+        start, end = span
+        updated_content = content[:start] + new_coords_section + content[end:]
         action = "Updated"
     else:
         # Append to end of file
@@ -528,6 +680,11 @@ def main():
         action='store_true',
         help='Only geocode missing ports, keep existing coordinates'
     )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help=f'Ignore cached lookups in {GEOCODE_CACHE_PATH} and re-query Nominatim'
+    )
     
     args = parser.parse_args()
     
@@ -574,7 +731,9 @@ def main():
         return
     
     # Geocode all ports
-    coordinates = geocode_all_ports(ports, dry_run=args.dry_run, existing_coords=existing_coords)
+    with GeocodeCache(refresh=args.refresh) as cache:
+        coordinates = geocode_all_ports(ports, dry_run=args.dry_run,
+                                        existing_coords=existing_coords, cache=cache)
     
     # Update scraper.py
     if coordinates:
@@ -0,0 +1,39 @@
+"""
+Locating the PORT_COORDINATES literal in scraper.py source.
+
+Shared by auto_geocode_ports.py and import_from_kml.py, which both
+rewrite that block in place.
+"""
+
+import re
+from typing import Optional, Tuple
+
+# Start of the PORT_COORDINATES literal in scraper.py
+_PORT_COORDINATES_START_RE = re.compile(r'^PORT_COORDINATES\s*=\s*\{', re.MULTILINE)
+_BRACE_OR_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]')
+
+
+def find_coordinates_block(content: str) -> Optional[Tuple[int, int]]:
+    """
+    Locate the PORT_COORDINATES = {...} literal in scraper.py source.
+    Returns (start, end) offsets covering it, or None if it isn't there.
+
+    Walks a brace-depth counter from the opening brace so the nested
+    {"lat": .., "lon": ..} dicts are handled. The regex jumps straight
+    from brace to brace, skipping quoted strings whole.
+    """
+    match = _PORT_COORDINATES_START_RE.search(content)
+    if not match:
+        return None
+
+    depth = 0
+    for token in _BRACE_OR_STRING_RE.finditer(content, match.end() - 1):
+        char = token.group()
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return (match.start(), token.end())
+
+    return None
@@ -8,8 +8,9 @@ Schema (v2 — hierarchical):
 """
 
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Iterator, Tuple
 
 
 class PortStatusDB:
@@ -17,21 +18,62 @@ class PortStatusDB:
 
     DB_PATH = "port_status.db"
 
+    # Hot-path inserts kept as fixed strings so sqlite3's per-connection
+    # statement cache (keyed on SQL text) reuses the compiled statement.
+    INSERT_ZONE_STATUS_SQL = """
+        INSERT INTO status_history (zone_id, subport_id, condition, comments, last_changed, marsec_level)
+        VALUES (?, NULL, ?, NULL, NULL, ?)
+    """
+    INSERT_SUBPORT_STATUS_SQL = """
+        INSERT INTO status_history (zone_id, subport_id, condition, comments, last_changed, marsec_level)
+        VALUES (?, ?, ?, ?, ?, NULL)
+    """
+
     def __init__(self, db_path: str = None):
         self.db_path = db_path or self.DB_PATH
         self.conn: Optional[sqlite3.Connection] = None
+        self._batching = False
 
     def __enter__(self):
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
         self.conn.row_factory = sqlite3.Row
         self.conn.execute("PRAGMA foreign_keys = ON;")
+        # WAL + NORMAL sync: commits append to the log instead of fsyncing
+        # the whole DB each time (still durable across app crashes)
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.execute("PRAGMA synchronous = NORMAL;")
+        self.conn.execute("PRAGMA temp_store = MEMORY;")
+        self.conn.execute("PRAGMA cache_size = -20000;")     # ~20 MB page cache
+        self.conn.execute("PRAGMA mmap_size = 268435456;")   # 256 MB memory-mapped reads
         self._create_tables()
         return self
 
     def __exit__(self, *args):
         if self.conn:
+            self.conn.execute("PRAGMA optimize;")
             self.conn.close()
 
+    # ------------------------------------------------------------------
+    # transactions
+    # ------------------------------------------------------------------
+    @contextmanager
+    def batch(self):
+        """
+        Group writes into one transaction:  with db.batch(): db.record_...(...)
+        Commits once on exit, rolls back if the block raises.
+        """
+        self._batching = True
+        try:
+            with self.conn:
+                yield self
+        finally:
+            self._batching = False
+
+    def _commit(self):
+        """Commit now, unless we're inside batch() (which commits on exit)."""
+        if not self._batching:
+            self.conn.commit()
+
     # ------------------------------------------------------------------
     # schema
     # ------------------------------------------------------------------
@@ -69,11 +111,34 @@ class PortStatusDB:
                 recorded_at  TEXT DEFAULT (datetime('now', 'utc'))
             );
 
-            CREATE INDEX IF NOT EXISTS idx_status_zone
-                ON status_history(zone_id, recorded_at DESC);
-            CREATE INDEX IF NOT EXISTS idx_status_subport
-                ON status_history(subport_id, recorded_at DESC);
+            -- zone and sub-port rows get separate partial indexes; these
+            -- superseded indexes on older databases (full-table, then
+            -- without the history_id tie-breaker)
+            DROP INDEX IF EXISTS idx_status_zone;
+            DROP INDEX IF EXISTS idx_status_subport;
+            DROP INDEX IF EXISTS idx_status_zone_latest;
+            DROP INDEX IF EXISTS idx_status_subport_latest;
+            -- latest zone-level row: partial (zone rows only) and covering
+            CREATE INDEX IF NOT EXISTS idx_status_zone_current
+                ON status_history(zone_id, recorded_at DESC, history_id DESC,
+                                  condition, marsec_level)
+                WHERE subport_id IS NULL;
+            -- latest sub-port row: partial (sub-port rows only); the
+            -- "subport_id = ?" lookups imply the IS NOT NULL predicate
+            CREATE INDEX IF NOT EXISTS idx_status_subport_current
+                ON status_history(subport_id, recorded_at DESC, history_id DESC)
+                WHERE subport_id IS NOT NULL;
+            -- "previous row for this sub-port" lookups in get_status_changes
+            CREATE INDEX IF NOT EXISTS idx_status_subport_history
+                ON status_history(subport_id, history_id);
         """)
+        # Seed planner statistics once so the partial/covering indexes above
+        # are costed correctly; PRAGMA optimize on close keeps them fresh.
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.conn.execute("ANALYZE")
         self.conn.commit()
 
     # ------------------------------------------------------------------
@@ -83,7 +148,7 @@ class PortStatusDB:
                     marsec_level: str = "", sector_info: str = "",
                     source_url: str = "") -> int:
         """Insert or update a COTP zone. Returns zone_id."""
-        self.conn.execute("""
+        row = self.conn.execute("""
             INSERT INTO cotp_zones (zone_name, latitude, longitude, marsec_level, sector_info, source_url)
             VALUES (?, ?, ?, ?, ?, ?)
             ON CONFLICT(zone_name) DO UPDATE SET
@@ -92,25 +157,22 @@ class PortStatusDB:
                 marsec_level = excluded.marsec_level,
                 sector_info  = excluded.sector_info,
                 source_url   = excluded.source_url
-        """, (zone_name, lat, lon, marsec_level, sector_info, source_url))
-        self.conn.commit()
-        row = self.conn.execute("SELECT zone_id FROM cotp_zones WHERE zone_name=?", (zone_name,)).fetchone()
+            RETURNING zone_id
+        """, (zone_name, lat, lon, marsec_level, sector_info, source_url)).fetchone()
+        self._commit()
         return row["zone_id"]
 
     def upsert_subport(self, zone_id: int, port_name: str, lat: float, lon: float) -> int:
         """Insert or update a sub-port. Returns subport_id."""
-        self.conn.execute("""
+        row = self.conn.execute("""
             INSERT INTO sub_ports (zone_id, port_name, latitude, longitude)
             VALUES (?, ?, ?, ?)
             ON CONFLICT(zone_id, port_name) DO UPDATE SET
                 latitude  = excluded.latitude,
                 longitude = excluded.longitude
-        """, (zone_id, port_name, lat, lon))
-        self.conn.commit()
-        row = self.conn.execute(
-            "SELECT subport_id FROM sub_ports WHERE zone_id=? AND port_name=?",
-            (zone_id, port_name)
-        ).fetchone()
+            RETURNING subport_id
+        """, (zone_id, port_name, lat, lon)).fetchone()
+        self._commit()
         return row["subport_id"]
 
     # ------------------------------------------------------------------
@@ -118,23 +180,36 @@ class PortStatusDB:
     # ------------------------------------------------------------------
     def record_zone_status(self, zone_id: int, condition: str,
                            marsec_level: str = ""):
-        self.conn.execute("""
-            INSERT INTO status_history (zone_id, subport_id, condition, comments, last_changed, marsec_level)
-            VALUES (?, NULL, ?, NULL, NULL, ?)
-        """, (zone_id, condition, marsec_level))
-        self.conn.commit()
+        self.record_zone_statuses([(zone_id, condition, marsec_level)])
+
+    def record_zone_statuses(self, records: Iterable[Tuple[int, str, str]]):
+        """
+        Insert many zone-level snapshots in one executemany + one commit.
+        Each record is (zone_id, condition, marsec_level).
+        """
+        self.conn.executemany(self.INSERT_ZONE_STATUS_SQL, records)
+        self._commit()
 
     def record_subport_status(self, zone_id: int, subport_id: int,
                               condition: str, comments: str = "",
                               last_changed: str = ""):
-        self.conn.execute("""
-            INSERT INTO status_history (zone_id, subport_id, condition, comments, last_changed, marsec_level)
-            VALUES (?, ?, ?, ?, ?, NULL)
-        """, (zone_id, subport_id, condition, comments, last_changed))
-        self.conn.commit()
+        self.record_subport_statuses([(zone_id, subport_id, condition, comments, last_changed)])
+
+    def record_subport_statuses(self, records: Iterable[Tuple[int, int, str, str, str]]):
+        """
+        Insert many sub-port snapshots in one executemany + one commit.
+        Each record is (zone_id, subport_id, condition, comments, last_changed).
+        """
+        self.conn.executemany(self.INSERT_SUBPORT_STATUS_SQL, records)
+        self._commit()
 
     # ------------------------------------------------------------------
     # read helpers used by generate_geojson
+    #
+    # "Latest status" joins use a correlated ORDER BY recorded_at DESC,
+    # history_id DESC LIMIT 1 lookup: one index probe per zone / sub-port,
+    # instead of aggregating the whole (ever-growing) status_history table.
+    # history_id breaks ties between rows recorded in the same second.
     # ------------------------------------------------------------------
     def get_all_zones(self) -> List[Dict]:
         """All COTP zones with their latest recorded condition."""
@@ -144,13 +219,12 @@ class PortStatusDB:
                    h.condition AS zone_condition,
                    h.recorded_at AS recorded_at
             FROM cotp_zones z
-            LEFT JOIN (
-                SELECT zone_id, condition, recorded_at
-                FROM status_history
-                WHERE subport_id IS NULL
-                GROUP BY zone_id
-                HAVING recorded_at = MAX(recorded_at)
-            ) h ON z.zone_id = h.zone_id
+            LEFT JOIN status_history h ON h.history_id = (
+                SELECT history_id FROM status_history
+                WHERE zone_id = z.zone_id AND subport_id IS NULL
+                ORDER BY recorded_at DESC, history_id DESC
+                LIMIT 1
+            )
         """).fetchall()
         return [dict(r) for r in rows]
 
@@ -160,13 +234,12 @@ class PortStatusDB:
             SELECT sp.subport_id, sp.port_name, sp.latitude, sp.longitude,
                    h.condition, h.comments, h.last_changed, h.recorded_at
             FROM sub_ports sp
-            LEFT JOIN (
-                SELECT subport_id, condition, comments, last_changed, recorded_at
-                FROM status_history
-                WHERE subport_id IS NOT NULL
-                GROUP BY subport_id
-                HAVING recorded_at = MAX(recorded_at)
-            ) h ON sp.subport_id = h.subport_id
+            LEFT JOIN status_history h ON h.history_id = (
+                SELECT history_id FROM status_history
+                WHERE subport_id = sp.subport_id
+                ORDER BY recorded_at DESC, history_id DESC
+                LIMIT 1
+            )
             WHERE sp.zone_id = ?
             ORDER BY sp.port_name
         """, (zone_id,)).fetchall()
@@ -181,13 +254,12 @@ class PortStatusDB:
                    h.condition, h.comments, h.last_changed, h.recorded_at
             FROM sub_ports sp
             JOIN cotp_zones z ON sp.zone_id = z.zone_id
-            LEFT JOIN (
-                SELECT subport_id, condition, comments, last_changed, recorded_at
-                FROM status_history
-                WHERE subport_id IS NOT NULL
-                GROUP BY subport_id
-                HAVING recorded_at = MAX(recorded_at)
-            ) h ON sp.subport_id = h.subport_id
+            LEFT JOIN status_history h ON h.history_id = (
+                SELECT history_id FROM status_history
+                WHERE subport_id = sp.subport_id
+                ORDER BY recorded_at DESC, history_id DESC
+                LIMIT 1
+            )
             ORDER BY z.zone_name, sp.port_name
         """).fetchall()
         return [dict(r) for r in rows]
@@ -195,36 +267,66 @@ class PortStatusDB:
     # ------------------------------------------------------------------
     # export helpers used by export_history.py
     # ------------------------------------------------------------------
+    @staticmethod
+    def _history_window(days: Optional[int]) -> Tuple[str, tuple]:
+        """WHERE clause + params restricting status_history to the last N days."""
+        if days is None:
+            return "", ()
+        return "WHERE sh.recorded_at >= datetime('now', ?, 'utc')", (f'-{days} days',)
+
+    def iter_all_history(self, days: int = None) -> Iterator[Dict]:
+        """
+        Stream status history records (newest first), optionally filtered to
+        the last N days. Rows are fetched from the cursor as you iterate.
+        """
+        where, params = self._history_window(days)
+        cursor = self.conn.execute(f"""
+            SELECT sh.history_id, sh.condition, sh.comments, sh.last_changed,
+                   sh.marsec_level, sh.recorded_at,
+                   COALESCE(sp.port_name, z.zone_name) AS port_name,
+                   z.zone_name, z.source_url,
+                   COALESCE(sp.latitude, z.latitude) AS latitude,
+                   COALESCE(sp.longitude, z.longitude) AS longitude
+            FROM status_history sh
+            LEFT JOIN cotp_zones z ON sh.zone_id = z.zone_id
+            LEFT JOIN sub_ports sp ON sh.subport_id = sp.subport_id
+            {where}
+            ORDER BY sh.recorded_at DESC
+        """, params)
+        return (dict(r) for r in cursor)
+
+    def history_csv_cursor(self, days: int = None) -> sqlite3.Cursor:
+        """
+        Status history (newest first) as plain tuples, already in the column
+        order of the history CSV export:
+            port_name, zone_name, latitude, longitude, condition, details,
+            marsec_level, restrictions, recorded_at, source_url
+        Hand it straight to csv.writer; no per-row dicts are built.
+        """
+        where, params = self._history_window(days)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor.execute(f"""
+            SELECT COALESCE(sp.port_name, z.zone_name),
+                   z.zone_name,
+                   COALESCE(sp.latitude, z.latitude),
+                   COALESCE(sp.longitude, z.longitude),
+                   sh.condition,
+                   sh.comments,
+                   sh.marsec_level,
+                   NULL,
+                   sh.recorded_at,
+                   z.source_url
+            FROM status_history sh
+            LEFT JOIN cotp_zones z ON sh.zone_id = z.zone_id
+            LEFT JOIN sub_ports sp ON sh.subport_id = sp.subport_id
+            {where}
+            ORDER BY sh.recorded_at DESC
+        """, params)
+
     def get_all_history(self, days: int = None) -> List[Dict]:
         """All status history records, optionally filtered to the last N days."""
-        if days is not None:
-            rows = self.conn.execute("""
-                SELECT sh.history_id, sh.condition, sh.comments, sh.last_changed,
-                       sh.marsec_level, sh.recorded_at,
-                       COALESCE(sp.port_name, z.zone_name) AS port_name,
-                       z.zone_name, z.source_url,
-                       COALESCE(sp.latitude, z.latitude) AS latitude,
-                       COALESCE(sp.longitude, z.longitude) AS longitude
-                FROM status_history sh
-                LEFT JOIN cotp_zones z ON sh.zone_id = z.zone_id
-                LEFT JOIN sub_ports sp ON sh.subport_id = sp.subport_id
-                WHERE sh.recorded_at >= datetime('now', ?, 'utc')
-                ORDER BY sh.recorded_at DESC
-            """, (f'-{days} days',)).fetchall()
-        else:
-            rows = self.conn.execute("""
-                SELECT sh.history_id, sh.condition, sh.comments, sh.last_changed,
-                       sh.marsec_level, sh.recorded_at,
-                       COALESCE(sp.port_name, z.zone_name) AS port_name,
-                       z.zone_name, z.source_url,
-                       COALESCE(sp.latitude, z.latitude) AS latitude,
-                       COALESCE(sp.longitude, z.longitude) AS longitude
-                FROM status_history sh
-                LEFT JOIN cotp_zones z ON sh.zone_id = z.zone_id
-                LEFT JOIN sub_ports sp ON sh.subport_id = sp.subport_id
-                ORDER BY sh.recorded_at DESC
-            """).fetchall()
-        return [dict(r) for r in rows]
+        return list(self.iter_all_history(days))
 
     def get_all_latest_statuses(self) -> List[Dict]:
         """Current (most-recent) status for every sub-port across all zones."""
@@ -235,13 +337,12 @@ class PortStatusDB:
                    h.recorded_at
             FROM sub_ports sp
             JOIN cotp_zones z ON sp.zone_id = z.zone_id
-            LEFT JOIN (
-                SELECT subport_id, condition, comments, marsec_level, recorded_at
-                FROM status_history
-                WHERE subport_id IS NOT NULL
-                GROUP BY subport_id
-                HAVING recorded_at = MAX(recorded_at)
-            ) h ON sp.subport_id = h.subport_id
+            LEFT JOIN status_history h ON h.history_id = (
+                SELECT history_id FROM status_history
+                WHERE subport_id = sp.subport_id
+                ORDER BY recorded_at DESC, history_id DESC
+                LIMIT 1
+            )
             ORDER BY z.zone_name, sp.port_name
         """).fetchall()
         return [dict(r) for r in rows]
@@ -262,6 +363,7 @@ class PortStatusDB:
                 JOIN cotp_zones z ON sp.zone_id = z.zone_id
             ) cur
             JOIN status_history cur_h ON cur_h.subport_id = cur.subport_id
+            -- predecessor = one descending probe of idx_status_subport_history
             LEFT JOIN status_history prev_h
                 ON prev_h.subport_id = cur.subport_id
                 AND prev_h.history_id = (
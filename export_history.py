@@ -7,18 +7,14 @@ import argparse
 from datetime import datetime
 from database import PortStatusDB
 
+# Rows pulled from the database cursor per CSV write
+EXPORT_BATCH_SIZE = 1000
+
 
 def export_to_csv(output_file: str, days: int = None):
     """Export complete history to CSV file"""
     
-    with PortStatusDB() as db:
-        history = db.get_all_history(days=days)
-    
-    if not history:
-        print("❌ No history data found")
-        return
-    
-    # Define CSV columns
+    # Define CSV columns (must match the column order of history_csv_cursor)
     fieldnames = [
         'port_name',
         'zone_name',
@@ -32,26 +28,27 @@ def export_to_csv(output_file: str, days: int = None):
         'source_url'
     ]
     
-    # Write to CSV
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    with PortStatusDB() as db:
+        cursor = db.history_csv_cursor(days=days)
+        first_rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
         
-        for record in history:
-            writer.writerow({
-                'port_name': record.get('port_name', ''),
-                'zone_name': record.get('zone_name', ''),
-                'latitude': record.get('latitude', ''),
-                'longitude': record.get('longitude', ''),
-                'condition': record.get('condition', ''),
-                'details': record.get('details', ''),
-                'marsec_level': record.get('marsec_level', ''),
-                'restrictions': record.get('restrictions', ''),
-                'recorded_at': record.get('recorded_at', ''),
-                'source_url': record.get('source_url', '')
-            })
-    
-    print(f"✅ Exported {len(history)} records to {output_file}")
+        if not first_rows:
+            print("❌ No history data found")
+            return
+        
+        # Stream rows from the cursor to CSV in batches
+        total = 0
+        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            
+            rows = first_rows
+            while rows:
+                writer.writerows(rows)
+                total += len(rows)
+                rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+    
+    print(f"✅ Exported {total} records to {output_file}")
 
 
 def export_port_summary(output_file: str):
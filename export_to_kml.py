@@ -16,54 +16,112 @@ Usage:
     python3 export_to_kml.py --output myports.kml
 """
 
-import json
 import argparse
+from collections import Counter, defaultdict, namedtuple
 from datetime import datetime
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+from operator import attrgetter
+from xml.sax.saxutils import XMLGenerator
 
+from json_helpers import json_loads
 
-def prettify_xml(elem):
-    """Return a pretty-printed XML string for the Element."""
-    rough_string = tostring(elem, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    return reparsed.toprettyxml(indent="  ")
+KML_NAMESPACE = 'http://www.opengis.net/kml/2.2'
+INDENT = '  '
+
+
+def start_element(xml, tag, depth, attrs=None):
+    """Write an indented opening tag."""
+    xml.ignorableWhitespace('\n' + INDENT * depth)
+    xml.startElement(tag, attrs or {})
+
+
+def end_element(xml, tag, depth):
+    """Write an indented closing tag for an element that has children."""
+    xml.ignorableWhitespace('\n' + INDENT * depth)
+    xml.endElement(tag)
+
+
+def text_element(xml, tag, text, depth):
+    """Write a leaf element holding only text."""
+    start_element(xml, tag, depth)
+    xml.characters(text)
+    xml.endElement(tag)
+
+
+# KML colors use AABBGGRR format (Alpha, Blue, Green, Red)
+CONDITION_COLORS = {
+    'NORMAL': 'ff00ff00',    # Green
+    'WHISKEY': 'ff00ffff',   # Yellow
+    'X-RAY': 'ff0099ff',     # Orange
+    'YANKEE': 'ff0066ff',    # Dark Orange
+    'ZULU': 'ff0000ff',      # Red
+    'UNKNOWN': 'ff808080',   # Gray
+}
+
+CONDITION_ICONS = {
+    'NORMAL': 'http://maps.google.com/mapfiles/kml/paddle/grn-circle.png',
+    'WHISKEY': 'http://maps.google.com/mapfiles/kml/paddle/ylw-circle.png',
+    'X-RAY': 'http://maps.google.com/mapfiles/kml/paddle/orange-circle.png',
+    'YANKEE': 'http://maps.google.com/mapfiles/kml/paddle/orange-circle.png',
+    'ZULU': 'http://maps.google.com/mapfiles/kml/paddle/red-circle.png',
+    'UNKNOWN': 'http://maps.google.com/mapfiles/kml/paddle/wht-circle.png',
+}
+
+# Shared <Style> definitions, one per condition plus the error style
+KML_STYLES = {
+    'NORMAL': ('normalStyle', 'ff00ff00'),
+    'WHISKEY': ('whiskeyStyle', 'ff00ffff'),
+    'X-RAY': ('xrayStyle', 'ff0099ff'),
+    'YANKEE': ('yankeeStyle', 'ff0066ff'),
+    'ZULU': ('zuluStyle', 'ff0000ff'),
+    'UNKNOWN': ('unknownStyle', 'ff808080'),
+    'ERROR': ('errorStyle', 'ffff00ff'),  # Bright magenta for errors
+}
+
+STYLE_URLS = {condition: f'#{style_id}' for condition, (style_id, _) in KML_STYLES.items()}
+
+# One sub-port as read from the GeoJSON; a tuple is smaller than a dict
+PortRecord = namedtuple(
+    'PortRecord',
+    'name zone_name condition comments last_changed coordinates is_error',
+)
+
+# Placemark description (HTML inside CDATA); optional rows are filled in
+# as whole strings so each port costs a single format call
+DESCRIPTION_TEMPLATE = """
+    <![CDATA[
+    <h3>{name}</h3>
+    <table border="1" cellpadding="5" style="border-collapse: collapse;">
+        <tr><td><b>Zone:</b></td><td>{zone_name}</td></tr>
+        <tr><td><b>Condition:</b></td><td style="color: {color};">{condition}</td></tr>
+        <tr><td><b>Last Changed:</b></td><td>{last_changed}</td></tr>
+        <tr><td><b>Coordinates:</b></td><td>{lat:.6f}, {lon:.6f}</td></tr>
+    {comments_row}{error_row}</table>]]>"""
+
+COMMENTS_ROW_TEMPLATE = "<tr><td><b>Comments:</b></td><td>{comments}</td></tr>"
+
+ERROR_ROW = """
+        <tr><td colspan="2" style="background-color: #ffcccc;">
+            <b>⚠️ WARNING: This port is at 0°N, 0°E (geocoding failed)</b><br/>
+            Please find the correct coordinates and update scraper.py
+        </td></tr>
+        """
 
 
 def get_color_by_condition(condition):
-    """
-    Return KML color code based on port condition.
-    KML uses AABBGGRR format (Alpha, Blue, Green, Red)
-    """
-    colors = {
-        'NORMAL': 'ff00ff00',    # Green
-        'WHISKEY': 'ff00ffff',   # Yellow
-        'X-RAY': 'ff0099ff',     # Orange
-        'YANKEE': 'ff0066ff',    # Dark Orange
-        'ZULU': 'ff0000ff',      # Red
-        'UNKNOWN': 'ff808080',   # Gray
-    }
-    return colors.get(condition, 'ff808080')
+    """Return KML color code based on port condition."""
+    return CONDITION_COLORS.get(condition, 'ff808080')
 
 
 def get_icon_by_condition(condition):
     """Return appropriate icon for condition."""
-    icons = {
-        'NORMAL': 'http://maps.google.com/mapfiles/kml/paddle/grn-circle.png',
-        'WHISKEY': 'http://maps.google.com/mapfiles/kml/paddle/ylw-circle.png',
-        'X-RAY': 'http://maps.google.com/mapfiles/kml/paddle/orange-circle.png',
-        'YANKEE': 'http://maps.google.com/mapfiles/kml/paddle/orange-circle.png',
-        'ZULU': 'http://maps.google.com/mapfiles/kml/paddle/red-circle.png',
-        'UNKNOWN': 'http://maps.google.com/mapfiles/kml/paddle/wht-circle.png',
-    }
-    return icons.get(condition, 'http://maps.google.com/mapfiles/kml/paddle/wht-circle.png')
+    return CONDITION_ICONS.get(condition, 'http://maps.google.com/mapfiles/kml/paddle/wht-circle.png')
 
 
 def load_ports_from_geojson():
     """Load ports from the GeoJSON file."""
     try:
-        with open('api/ports.geojson', 'r') as f:
-            data = json.load(f)
+        with open('api/ports.geojson', 'rb') as f:
+            data = json_loads(f.read())
         return data
     except FileNotFoundError:
         print("❌ Error: api/ports.geojson not found!")
@@ -71,95 +129,68 @@ def load_ports_from_geojson():
         return None
 
 
-def create_kml_styles(kml):
-    """Create KML styles for different port conditions."""
-    styles = {
-        'NORMAL': ('normalStyle', 'ff00ff00'),
-        'WHISKEY': ('whiskeyStyle', 'ff00ffff'),
-        'X-RAY': ('xrayStyle', 'ff0099ff'),
-        'YANKEE': ('yankeeStyle', 'ff0066ff'),
-        'ZULU': ('zuluStyle', 'ff0000ff'),
-        'UNKNOWN': ('unknownStyle', 'ff808080'),
-        'ERROR': ('errorStyle', 'ffff00ff'),  # Bright magenta for errors
-    }
-    
-    document = kml.find('Document')
-    
-    for condition, (style_id, color) in styles.items():
-        style = SubElement(document, 'Style', id=style_id)
-        icon_style = SubElement(style, 'IconStyle')
-        SubElement(icon_style, 'color').text = color
-        SubElement(icon_style, 'scale').text = '1.2'
-        icon = SubElement(icon_style, 'Icon')
-        SubElement(icon, 'href').text = get_icon_by_condition(condition)
+def create_kml_styles(xml, depth):
+    """Write KML styles for different port conditions."""
+    for condition, (style_id, color) in KML_STYLES.items():
+        start_element(xml, 'Style', depth, {'id': style_id})
+        start_element(xml, 'IconStyle', depth + 1)
+        text_element(xml, 'color', color, depth + 2)
+        text_element(xml, 'scale', '1.2', depth + 2)
+        start_element(xml, 'Icon', depth + 2)
+        text_element(xml, 'href', get_icon_by_condition(condition), depth + 3)
+        end_element(xml, 'Icon', depth + 2)
+        end_element(xml, 'IconStyle', depth + 1)
         
-        label_style = SubElement(style, 'LabelStyle')
-        SubElement(label_style, 'scale').text = '0.9'
+        start_element(xml, 'LabelStyle', depth + 1)
+        text_element(xml, 'scale', '0.9', depth + 2)
+        end_element(xml, 'LabelStyle', depth + 1)
+        end_element(xml, 'Style', depth)
 
 
-def create_placemark(folder, port_data):
-    """Create a KML placemark for a port."""
-    placemark = SubElement(folder, 'Placemark')
-    
-    port_name = port_data['name']
-    condition = port_data.get('condition', 'UNKNOWN')
-    comments = port_data.get('comments', '')
-    last_changed = port_data.get('last_changed', 'Unknown')
-    zone_name = port_data.get('zone_name', '')
-    coords = port_data['coordinates']
+def create_placemark(xml, port_data, depth):
+    """Write a KML placemark for a port."""
+    start_element(xml, 'Placemark', depth)
     
-    # Check if this is a failed geocode (at 0,0)
-    is_error = (coords[0] == 0.0 and coords[1] == 0.0)
+    port_name = port_data.name
+    condition = port_data.condition
+    comments = port_data.comments
+    last_changed = port_data.last_changed
+    zone_name = port_data.zone_name
+    coords = port_data.coordinates
+    is_error = port_data.is_error
     
     # Name
     name_text = f"{port_name}"
     if is_error:
         name_text += " ⚠️ NEEDS COORDINATES"
-    SubElement(placemark, 'name').text = name_text
+    text_element(xml, 'name', name_text, depth + 1)
     
-    # Description with HTML formatting
-    description_html = f"""
-    <![CDATA[
-    <h3>{port_name}</h3>
-    <table border="1" cellpadding="5" style="border-collapse: collapse;">
-        <tr><td><b>Zone:</b></td><td>{zone_name}</td></tr>
-        <tr><td><b>Condition:</b></td><td style="color: {'green' if condition == 'NORMAL' else 'red'};">{condition}</td></tr>
-        <tr><td><b>Last Changed:</b></td><td>{last_changed}</td></tr>
-        <tr><td><b>Coordinates:</b></td><td>{coords[1]:.6f}, {coords[0]:.6f}</td></tr>
-    """
-    
-    if comments:
-        description_html += f"<tr><td><b>Comments:</b></td><td>{comments}</td></tr>"
-    
-    if is_error:
-        description_html += """
-        <tr><td colspan="2" style="background-color: #ffcccc;">
-            <b>⚠️ WARNING: This port is at 0°N, 0°E (geocoding failed)</b><br/>
-            Please find the correct coordinates and update scraper.py
-        </td></tr>
-        """
-    
-    description_html += "</table>]]>"
+    # Description with HTML formatting (one format call per placemark)
+    description_html = DESCRIPTION_TEMPLATE.format(
+        name=port_name,
+        zone_name=zone_name,
+        color='green' if condition == 'NORMAL' else 'red',
+        condition=condition,
+        last_changed=last_changed,
+        lat=coords[1],
+        lon=coords[0],
+        comments_row=COMMENTS_ROW_TEMPLATE.format(comments=comments) if comments else '',
+        error_row=ERROR_ROW if is_error else '',
+    )
     
-    SubElement(placemark, 'description').text = description_html
+    text_element(xml, 'description', description_html, depth + 1)
     
     # Style
-    style_url = '#errorStyle' if is_error else f'#{condition.lower()}Style'
-    if condition in ['NORMAL', 'WHISKEY', 'X-RAY', 'YANKEE', 'ZULU']:
-        style_url = f'#{condition.lower()}Style'
-    else:
-        style_url = '#unknownStyle'
+    style_url = '#errorStyle' if is_error else STYLE_URLS.get(condition, '#unknownStyle')
     
-    if is_error:
-        style_url = '#errorStyle'
-    
-    SubElement(placemark, 'styleUrl').text = style_url
+    text_element(xml, 'styleUrl', style_url, depth + 1)
     
     # Coordinates (KML uses lon,lat,altitude)
-    point = SubElement(placemark, 'Point')
-    SubElement(point, 'coordinates').text = f"{coords[0]},{coords[1]},0"
+    start_element(xml, 'Point', depth + 1)
+    text_element(xml, 'coordinates', f"{coords[0]},{coords[1]},0", depth + 2)
+    end_element(xml, 'Point', depth + 1)
     
-    return placemark
+    end_element(xml, 'Placemark', depth)
 
 
 def export_to_kml(output_file='ports.kml'):
@@ -174,89 +205,94 @@ def export_to_kml(output_file='ports.kml'):
     if not geojson_data:
         return False
     
-    # Create KML root
-    kml = Element('kml', xmlns='http://www.opengis.net/kml/2.2')
-    document = SubElement(kml, 'Document')
-    SubElement(document, 'name').text = 'USCG Port Status Monitor'
-    SubElement(document, 'description').text = f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'
-    
-    # Create styles
-    create_kml_styles(kml)
-    
-    # Group ports by zone
-    zones = {}
+    # Group ports by zone (and collect error ports) in a single pass
+    zones = defaultdict(list)
     error_ports = []
     
-    for feature in geojson_data['features']:
+    # Only process sub-ports (individual ports, not zones)
+    subport_features = [f for f in geojson_data['features']
+                        if f['properties'].get('type') == 'sub_port']
+    
+    for feature in subport_features:
         props = feature['properties']
         coords = feature['geometry']['coordinates']
         
-        # Only process sub-ports (individual ports, not zones)
-        if props.get('type') != 'sub_port':
-            continue
-        
         zone_name = props.get('zone_name', 'Unknown Zone')
         
-        port_data = {
-            'name': props['name'],
-            'zone_name': zone_name,
-            'condition': props.get('condition', 'UNKNOWN'),
-            'comments': props.get('comments', ''),
-            'last_changed': props.get('last_changed', 'Unknown'),
-            'coordinates': coords
-        }
+        port_data = PortRecord(
+            name=props['name'],
+            zone_name=zone_name,
+            condition=props.get('condition', 'UNKNOWN'),
+            comments=props.get('comments', ''),
+            last_changed=props.get('last_changed', 'Unknown'),
+            coordinates=coords,
+            # Failed geocode (at 0,0); decided once here, reused when writing
+            is_error=coords[0] == 0.0 and coords[1] == 0.0,
+        )
         
         # Track error ports separately
-        if coords[0] == 0.0 and coords[1] == 0.0:
+        if port_data.is_error:
             error_ports.append(port_data)
         
         # Add to zone
-        if zone_name not in zones:
-            zones[zone_name] = []
         zones[zone_name].append(port_data)
     
-    # Create "ERRORS - NEEDS COORDINATES" folder first (most important)
-    if error_ports:
-        error_folder = SubElement(document, 'Folder')
-        SubElement(error_folder, 'name').text = f'⚠️ ERRORS - NEEDS COORDINATES ({len(error_ports)} ports)'
-        SubElement(error_folder, 'description').text = 'These ports failed geocoding and are at 0°N, 0°E'
-        SubElement(error_folder, 'open').text = '1'  # Open by default
-        
-        for port_data in sorted(error_ports, key=lambda x: x['name']):
-            create_placemark(error_folder, port_data)
+    # Sort every bucket once up front
+    by_name = attrgetter('name')
+    error_ports.sort(key=by_name)
+    for zone_ports in zones.values():
+        zone_ports.sort(key=by_name)
     
-    # Create folders for each zone
-    for zone_name in sorted(zones.keys()):
-        zone_ports = zones[zone_name]
-        
-        # Count ports by condition
-        condition_counts = {}
-        for port in zone_ports:
-            condition = port['condition']
-            condition_counts[condition] = condition_counts.get(condition, 0) + 1
+    # Stream the KML straight to disk; no in-memory element tree
+    with open(output_file, 'w', encoding='utf-8') as f:
+        xml = XMLGenerator(f, 'UTF-8', short_empty_elements=True)
+        xml.startDocument()
+        xml.startElement('kml', {'xmlns': KML_NAMESPACE})
+        start_element(xml, 'Document', 1)
+        text_element(xml, 'name', 'USCG Port Status Monitor', 2)
+        text_element(xml, 'description', f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}', 2)
         
-        folder = SubElement(document, 'Folder')
+        # Create styles
+        create_kml_styles(xml, 2)
         
-        # Folder name with counts
-        folder_name = f"{zone_name} ({len(zone_ports)} ports)"
-        if len(condition_counts) > 1 or 'NORMAL' not in condition_counts:
-            # Show condition breakdown if not all normal
-            status_summary = ', '.join([f"{count} {cond}" for cond, count in sorted(condition_counts.items())])
-            folder_name += f" - {status_summary}"
+        # Create "ERRORS - NEEDS COORDINATES" folder first (most important)
+        if error_ports:
+            start_element(xml, 'Folder', 2)
+            text_element(xml, 'name', f'⚠️ ERRORS - NEEDS COORDINATES ({len(error_ports)} ports)', 3)
+            text_element(xml, 'description', 'These ports failed geocoding and are at 0°N, 0°E', 3)
+            text_element(xml, 'open', '1', 3)  # Open by default
+            
+            for port_data in error_ports:
+                create_placemark(xml, port_data, 3)
+            end_element(xml, 'Folder', 2)
         
-        SubElement(folder, 'name').text = folder_name
+        # Create folders for each zone
+        for zone_name, zone_ports in sorted(zones.items()):
+            
+            # Count ports by condition
+            condition_counts = Counter(port.condition for port in zone_ports)
+            
+            # Folder name with counts
+            folder_name = f"{zone_name} ({len(zone_ports)} ports)"
+            if len(condition_counts) > 1 or 'NORMAL' not in condition_counts:
+                # Show condition breakdown if not all normal
+                status_summary = ', '.join([f"{count} {cond}" for cond, count in sorted(condition_counts.items())])
+                folder_name += f" - {status_summary}"
+            
+            start_element(xml, 'Folder', 2)
+            text_element(xml, 'name', folder_name, 3)
+            
+            # Add placemarks for each port in this zone
+            for port_data in zone_ports:
+                create_placemark(xml, port_data, 3)
+            end_element(xml, 'Folder', 2)
         
-        # Add placemarks for each port in this zone
-        for port_data in sorted(zone_ports, key=lambda x: x['name']):
-            create_placemark(folder, port_data)
-    
-    # Write KML file
-    kml_string = prettify_xml(kml)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(kml_string)
+        end_element(xml, 'Document', 1)
+        end_element(xml, 'kml', 0)
+        xml.endDocument()
+        f.write('\n')
     
-    print(f"✅ Exported {len([f for f in geojson_data['features'] if f['properties'].get('type') == 'sub_port'])} ports to: {output_file}")
+    print(f"✅ Exported {len(subport_features)} ports to: {output_file}")
     print()
     
     if error_ports:
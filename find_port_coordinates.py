@@ -8,149 +8,137 @@ Usage:
     python find_port_coordinates.py --search "Port of Miami"  # Find coordinates for a specific port
 """
 
-import json
 import argparse
+import csv
+from collections import defaultdict
+
+from json_helpers import iter_features
 
 def load_current_geojson():
-    """Load the current ports.geojson to see what ports exist."""
+    """
+    Open the current ports.geojson to see what ports exist.
+    Returns an iterator of (properties, coordinates) per feature, or None
+    if the file is missing.
+    """
     try:
-        with open('api/ports.geojson', 'r') as f:
-            data = json.load(f)
-        return data
+        f = open('api/ports.geojson', 'rb')
     except FileNotFoundError:
         print("Error: api/ports.geojson not found!")
         print("Make sure you're running this from your project root folder.")
         return None
+    return iter_features(f)
+
+BANNER_RULE = "=" * 70
+
+# Static tail of the --list report
+LIST_FOOTER = """
+💡 NEXT STEPS:
+   1. Pick a zone to work on (start with your most important ports)
+   2. For each port, search Google Maps for coordinates
+   3. Add them to the PORT_COORDINATES dict in scraper.py
+
+📋 EXAMPLE:
+   PORT_COORDINATES = {
+       "PORT OF MIAMI": {"lat": 25.7617, "lon": -80.1918},
+       "PORT OF HOUSTON": {"lat": 29.7604, "lon": -95.2631},
+   }
+"""
+
+SEARCH_INSTRUCTIONS = """\
+{rule}
+FINDING COORDINATES FOR: {port_name}
+{rule}
+
+📍 HOW TO FIND COORDINATES:
+
+1. Go to Google Maps: https://www.google.com/maps
+2. Search for: "{port_name}"
+3. Right-click on the port location
+4. Click on the coordinates that appear at the top
+5. They'll be copied to your clipboard!
+
+🔍 ALTERNATIVE METHODS:
+
+   • USCG Homeport: https://homeport.uscg.mil/
+   • MarineTraffic: https://www.marinetraffic.com/
+   • Wikipedia (many ports have infoboxes with coordinates)
+
+📝 COORDINATE FORMAT:
+
+   Google Maps gives you: 25.7617, -80.1918
+                           ^^^^^^  ^^^^^^^^
+                          latitude longitude
+
+   Add to scraper.py as:
+   "{port_upper}": {{"lat": 25.7617, "lon": -80.1918}}
+
+⚠️  IMPORTANT:
+   - Latitude comes first in Google Maps
+   - In GeoJSON, longitude comes first!
+   - scraper.py will handle the conversion automatically
+"""
 
 def list_ports_without_coordinates():
     """List all unique sub-ports and check which ones share coordinates (fake offsets)."""
-    data = load_current_geojson()
-    if not data:
+    features = load_current_geojson()
+    if features is None:
         return
     
-    print("=" * 70)
-    print("ANALYZING PORTS IN YOUR GEOJSON")
-    print("=" * 70)
-    print()
+    # Build the whole report, then write it once
+    out = [BANNER_RULE, "ANALYZING PORTS IN YOUR GEOJSON", BANNER_RULE, ""]
     
-    # Track coordinates to find duplicates/offsets
-    coord_map = {}
-    zone_coords = {}
+    # Track coordinates to find duplicates/offsets: (lon, lat) -> [(zone, port), ...]
+    coord_map = defaultdict(list)
     
-    for feature in data['features']:
-        props = feature['properties']
-        coords = tuple(feature['geometry']['coordinates'])
-        
-        if props.get('type') == 'cotp_zone':
-            zone_name = props['name']
-            zone_coords[zone_name] = coords
-        elif props.get('type') == 'sub_port':
-            zone_name = props.get('zone_name', 'Unknown')
-            port_name = props['name']
-            
-            if coords not in coord_map:
-                coord_map[coords] = []
-            coord_map[coords].append({
-                'zone': zone_name,
-                'port': port_name
-            })
+    for props, coords in features:
+        if props.get('type') == 'sub_port':
+            coord_map[coords[0], coords[1]].append((props.get('zone_name', 'Unknown'), props['name']))
     
     # Find ports that share coordinates (likely fake offsets)
-    print("🔍 PORTS WITH SHARED/OFFSET COORDINATES (Need Real Coords):")
-    print("-" * 70)
+    out.append("🔍 PORTS WITH SHARED/OFFSET COORDINATES (Need Real Coords):")
+    out.append("-" * 70)
     
-    zones_needing_work = {}
+    zones_needing_work = defaultdict(list)
     
-    for coords, ports in coord_map.items():
+    for ports in coord_map.values():
         if len(ports) > 1:
             # Multiple ports at same/similar location - definitely need real coords
-            for port_info in ports:
-                zone = port_info['zone']
-                if zone not in zones_needing_work:
-                    zones_needing_work[zone] = []
-                zones_needing_work[zone].append(port_info['port'])
+            for zone, port in ports:
+                zones_needing_work[zone].append(port)
     
     # Print by zone
     total_ports = 0
     for zone in sorted(zones_needing_work.keys()):
-        print(f"\n📍 {zone}")
-        print("   Ports needing real coordinates:")
+        out.append(f"\n📍 {zone}")
+        out.append("   Ports needing real coordinates:")
         for port in sorted(zones_needing_work[zone]):
-            print(f"      - {port}")
+            out.append(f"      - {port}")
             total_ports += 1
     
-    print()
-    print("=" * 70)
-    print(f"SUMMARY: {total_ports} ports need real coordinates")
-    print("=" * 70)
-    print()
-    print("💡 NEXT STEPS:")
-    print("   1. Pick a zone to work on (start with your most important ports)")
-    print("   2. For each port, search Google Maps for coordinates")
-    print("   3. Add them to the PORT_COORDINATES dict in scraper.py")
-    print()
-    print("📋 EXAMPLE:")
-    print('   PORT_COORDINATES = {')
-    print('       "PORT OF MIAMI": {"lat": 25.7617, "lon": -80.1918},')
-    print('       "PORT OF HOUSTON": {"lat": 29.7604, "lon": -95.2631},')
-    print('   }')
-    print()
+    out += ["", BANNER_RULE, f"SUMMARY: {total_ports} ports need real coordinates", BANNER_RULE]
+    out.append(LIST_FOOTER)
+    print("\n".join(out))
 
 def search_port_instructions(port_name):
     """Provide instructions for finding a specific port's coordinates."""
-    print("=" * 70)
-    print(f"FINDING COORDINATES FOR: {port_name}")
-    print("=" * 70)
-    print()
-    print("📍 HOW TO FIND COORDINATES:")
-    print()
-    print("1. Go to Google Maps: https://www.google.com/maps")
-    print(f"2. Search for: \"{port_name}\"")
-    print("3. Right-click on the port location")
-    print("4. Click on the coordinates that appear at the top")
-    print("5. They'll be copied to your clipboard!")
-    print()
-    print("🔍 ALTERNATIVE METHODS:")
-    print()
-    print("   • USCG Homeport: https://homeport.uscg.mil/")
-    print("   • MarineTraffic: https://www.marinetraffic.com/")
-    print("   • Wikipedia (many ports have infoboxes with coordinates)")
-    print()
-    print("📝 COORDINATE FORMAT:")
-    print()
-    print("   Google Maps gives you: 25.7617, -80.1918")
-    print("                           ^^^^^^  ^^^^^^^^")
-    print("                          latitude longitude")
-    print()
-    print("   Add to scraper.py as:")
-    print(f'   "{port_name.upper()}": {{"lat": 25.7617, "lon": -80.1918}}')
-    print()
-    print("⚠️  IMPORTANT:")
-    print("   - Latitude comes first in Google Maps")
-    print("   - In GeoJSON, longitude comes first!")
-    print("   - scraper.py will handle the conversion automatically")
-    print()
+    print(SEARCH_INSTRUCTIONS.format(rule=BANNER_RULE, port_name=port_name,
+                                     port_upper=port_name.upper()))
 
 def export_port_list():
     """Export a CSV of all ports for batch geocoding."""
-    data = load_current_geojson()
-    if not data:
+    features = load_current_geojson()
+    if features is None:
         return
     
-    ports = []
-    for feature in data['features']:
-        if feature['properties'].get('type') == 'sub_port':
-            ports.append({
-                'zone': feature['properties'].get('zone_name', ''),
-                'port': feature['properties']['name']
-            })
+    ports = [(props.get('zone_name', ''), props['name'])
+             for props, _ in features if props.get('type') == 'sub_port']
     
-    # Write CSV
+    # Write CSV (unquoted header, quoted fields as before; embedded quotes now escaped)
     output_file = 'ports_to_geocode.csv'
-    with open(output_file, 'w') as f:
+    with open(output_file, 'w', newline='') as f:
         f.write("Zone,Port Name\n")
-        for port in sorted(ports, key=lambda x: (x['zone'], x['port'])):
-            f.write(f'"{port["zone"]}","{port["port"]}"\n')
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator='\n')
+        writer.writerows(sorted(ports))
     
     print(f"✅ Exported {len(ports)} ports to: {output_file}")
     print()
@@ -9,74 +9,98 @@ Usage:
     python3 generate_fix_checklist.py
 """
 
-import json
 import re
+from collections import defaultdict
+from functools import lru_cache
 
+from json_helpers import iter_features
 
+
+# Zone-name keywords -> state, for search hints
+ZONE_STATES = {
+    'CHARLESTON': 'South Carolina',
+    'MIAMI': 'Florida',
+    'BOSTON': 'Massachusetts',
+    'NEW YORK': 'New York',
+    'HOUSTON': 'Texas',
+    'LOS ANGELES': 'California',
+    'SEATTLE': 'Washington',
+    'ALASKA': 'Alaska',
+    'HAWAII': 'Hawaii',
+    'PUERTO RICO': 'Puerto Rico',
+    'SAN JUAN': 'Puerto Rico',
+    'GUAM': 'Guam',
+    'VIRGINIA': 'Virginia',
+    'MARYLAND': 'Maryland',
+    'DELAWARE': 'Delaware',
+    'PENNSYLVANIA': 'Pennsylvania',
+    'GREAT LAKES': 'Michigan/Illinois',
+    'LAKE MICHIGAN': 'Michigan',
+    'DETROIT': 'Michigan',
+    'DULUTH': 'Minnesota',
+    'MOBILE': 'Alabama',
+    'NEW ORLEANS': 'Louisiana',
+    'GALVESTON': 'Texas',
+    'PORTLAND': 'Oregon',
+    'SAN FRANCISCO': 'California',
+    'SAN DIEGO': 'California',
+}
+
+# One alternation over all keywords; search() returns the leftmost hit
+_ZONE_STATE_RE = re.compile('|'.join(re.escape(key) for key in ZONE_STATES))
+
+# State codes around port names, e.g. "ROCKPORT, TX" / "TX, ROCKPORT"
+_TRAILING_STATE_CODE_RE = re.compile(r',\s*[A-Z]{2}$')
+_LEADING_STATE_CODE_RE = re.compile(r'^[A-Z]{2},\s*')
+
+# Checklist text pieces; the .format methods are bound once
+RULE = "=" * 70
+_format_zone_header = f"\n{RULE}\nZONE: {{}} ({{}} ports)\n{RULE}\n\n".format
+_format_entry = "[ ] {}\n    Zone: {}\n    Google Search:\n".format
+_format_hint = "      • {}\n".format
+_format_summary = "  {}: {} ports\n".format
+
+# Static instructions block at the top of the checklist file
+CHECKLIST_HOWTO = """\
+HOW TO USE THIS LIST:
+1. Open ports.kml in Google Earth
+2. Find the port in the 'ERRORS' folder (bright magenta at 0°N, 0°E)
+3. Use the search hints below to find the correct location
+4. Drag the pin to the correct spot in Google Earth
+5. Check off the port below
+6. When done, save the KML and run: python3 import_from_kml.py
+
+"""
+
+
+@lru_cache(maxsize=256)
 def extract_state_from_zone(zone_name):
     """Try to extract state from zone name."""
-    states = {
-        'CHARLESTON': 'South Carolina',
-        'MIAMI': 'Florida',
-        'BOSTON': 'Massachusetts',
-        'NEW YORK': 'New York',
-        'HOUSTON': 'Texas',
-        'LOS ANGELES': 'California',
-        'SEATTLE': 'Washington',
-        'ALASKA': 'Alaska',
-        'HAWAII': 'Hawaii',
-        'PUERTO RICO': 'Puerto Rico',
-        'SAN JUAN': 'Puerto Rico',
-        'GUAM': 'Guam',
-        'VIRGINIA': 'Virginia',
-        'MARYLAND': 'Maryland',
-        'DELAWARE': 'Delaware',
-        'PENNSYLVANIA': 'Pennsylvania',
-        'GREAT LAKES': 'Michigan/Illinois',
-        'LAKE MICHIGAN': 'Michigan',
-        'DETROIT': 'Michigan',
-        'DULUTH': 'Minnesota',
-        'MOBILE': 'Alabama',
-        'NEW ORLEANS': 'Louisiana',
-        'GALVESTON': 'Texas',
-        'PORTLAND': 'Oregon',
-        'SAN FRANCISCO': 'California',
-        'SAN DIEGO': 'California',
-    }
-    
-    for key, state in states.items():
-        if key in zone_name.upper():
-            return state
-    
-    return None
+    match = _ZONE_STATE_RE.search(zone_name.upper())
+    return ZONE_STATES[match.group(0)] if match else None
 
 
 def generate_search_hints(port_name, zone_name):
     """Generate helpful search queries for finding a port."""
     state = extract_state_from_zone(zone_name)
     
-    hints = []
-    
-    # Clean up the name
-    clean_name = port_name.strip()
+    # Clean up the name, removing state codes if present
+    clean_name = _TRAILING_STATE_CODE_RE.sub('', port_name.strip())
+    clean_name = _LEADING_STATE_CODE_RE.sub('', clean_name)
     
-    # Remove state codes if present
-    clean_name = re.sub(r',\s*[A-Z]{2}$', '', clean_name)
-    clean_name = re.sub(r'^[A-Z]{2},\s*', '', clean_name)
-    
-    # Basic searches
+    # Basic searches, then a NOAA chart search
     if state:
-        hints.append(f'"{clean_name}, {state}"')
-        hints.append(f'"Port {clean_name} {state}"')
-        hints.append(f'"{clean_name} harbor {state}"')
-    else:
-        hints.append(f'"{clean_name} United States"')
-        hints.append(f'"Port {clean_name}"')
-    
-    # Add NOAA chart search
-    hints.append(f'"NOAA chart {clean_name}"')
-    
-    return hints
+        return (
+            f'"{clean_name}, {state}"',
+            f'"Port {clean_name} {state}"',
+            f'"{clean_name} harbor {state}"',
+            f'"NOAA chart {clean_name}"',
+        )
+    return (
+        f'"{clean_name} United States"',
+        f'"Port {clean_name}"',
+        f'"NOAA chart {clean_name}"',
+    )
 
 
 def main():
@@ -85,94 +109,71 @@ def main():
     print("=" * 70)
     print()
     
-    # Load ports.geojson
+    # Find ports at 0,0 while streaming ports.geojson, grouped by zone as we go
+    by_zone = defaultdict(list)
+    
     try:
-        with open('api/ports.geojson', 'r') as f:
-            data = json.load(f)
+        with open('api/ports.geojson', 'rb') as f:
+            for props, coords in iter_features(f):
+                if coords[0] == 0.0 and coords[1] == 0.0 and props.get('type') == 'sub_port':
+                    by_zone[props.get('zone_name', 'Unknown')].append(props['name'])
     except FileNotFoundError:
         print("❌ Error: api/ports.geojson not found!")
         print("   Run: python3 update_ports.py")
         return
     
-    # Find ports at 0,0
-    needs_fixing = []
-    
-    for feature in data['features']:
-        if feature['properties'].get('type') != 'sub_port':
-            continue
-        
-        coords = feature['geometry']['coordinates']
-        
-        if coords[0] == 0.0 and coords[1] == 0.0:
-            needs_fixing.append({
-                'name': feature['properties']['name'],
-                'zone': feature['properties'].get('zone_name', 'Unknown'),
-            })
-    
-    if not needs_fixing:
+    if not by_zone:
         print("🎉 No ports need fixing! All have coordinates.")
         return
     
-    print(f"Found {len(needs_fixing)} ports needing coordinates")
+    # Sort zones and the ports within each zone once, up front
+    zones = sorted(by_zone.items())
+    for _, port_names in zones:
+        port_names.sort()
+    total = sum(len(port_names) for _, port_names in zones)
+    
+    print(f"Found {total} ports needing coordinates")
     print()
     
     # Generate checklist file
     output_file = 'manual_fix_checklist.txt'
     
-    with open(output_file, 'w') as f:
-        f.write("=" * 70 + "\n")
-        f.write("MANUAL COORDINATE FIX CHECKLIST\n")
-        f.write(f"Total ports to fix: {len(needs_fixing)}\n")
-        f.write("=" * 70 + "\n\n")
-        
-        f.write("HOW TO USE THIS LIST:\n")
-        f.write("1. Open ports.kml in Google Earth\n")
-        f.write("2. Find the port in the 'ERRORS' folder (bright magenta at 0°N, 0°E)\n")
-        f.write("3. Use the search hints below to find the correct location\n")
-        f.write("4. Drag the pin to the correct spot in Google Earth\n")
-        f.write("5. Check off the port below\n")
-        f.write("6. When done, save the KML and run: python3 import_from_kml.py\n")
-        f.write("\n")
-        f.write("=" * 70 + "\n\n")
+    parts = [
+        RULE, "\n",
+        "MANUAL COORDINATE FIX CHECKLIST\n",
+        f"Total ports to fix: {total}\n",
+        RULE, "\n\n",
+        CHECKLIST_HOWTO,
+        RULE, "\n\n",
+    ]
+    append = parts.append
+    
+    # Checklist entries
+    for zone, port_names in zones:
+        append(_format_zone_header(zone, len(port_names)))
         
-        # Group by zone
-        by_zone = {}
-        for port in needs_fixing:
-            zone = port['zone']
-            if zone not in by_zone:
-                by_zone[zone] = []
-            by_zone[zone].append(port)
-        
-        # Write checklist
-        for zone in sorted(by_zone.keys()):
-            f.write(f"\n{'=' * 70}\n")
-            f.write(f"ZONE: {zone} ({len(by_zone[zone])} ports)\n")
-            f.write(f"{'=' * 70}\n\n")
+        for port_name in port_names:
+            append(_format_entry(port_name, zone))
             
-            for port in sorted(by_zone[zone], key=lambda x: x['name']):
-                f.write(f"[ ] {port['name']}\n")
-                f.write(f"    Zone: {zone}\n")
-                
-                # Add search hints
-                hints = generate_search_hints(port['name'], zone)
-                f.write(f"    Google Search:\n")
-                for hint in hints[:3]:
-                    f.write(f"      • {hint}\n")
-                
-                f.write("\n")
-        
-        # Summary at end
-        f.write("\n" + "=" * 70 + "\n")
-        f.write("SUMMARY BY ZONE\n")
-        f.write("=" * 70 + "\n\n")
-        
-        for zone in sorted(by_zone.keys()):
-            f.write(f"  {zone}: {len(by_zone[zone])} ports\n")
+            # Add search hints
+            for hint in generate_search_hints(port_name, zone)[:3]:
+                append(_format_hint(hint))
+            
+            append("\n")
+    
+    # Summary at end
+    append(f"\n{RULE}\nSUMMARY BY ZONE\n{RULE}\n\n")
+    for zone, port_names in zones:
+        append(_format_summary(zone, len(port_names)))
+    
+    # One join, one write
+    with open(output_file, 'w') as f:
+        f.write("".join(parts))
     
     print(f"✅ Created: {output_file}")
     print()
     print("📋 This file contains:")
-    print(f"   • All {len(needs_fixing)} ports needing coordinates")
+    print(f"   • All {total} ports needing coordinates")
     print("   • Organized by COTP zone")
     print("   • Search hints for each port")
     print("   • Checkboxes to track progress")
@@ -18,9 +18,57 @@ Usage:
 """
 
 import argparse
+import ast
+import heapq
 import math
+import os
 import re
-from xml.etree import ElementTree as ET
+import shutil
+import tempfile
+from itertools import islice
+from operator import itemgetter
+
+try:
+    from lxml import etree as ET        # optional (in requirements.txt): C iterparse with tag filtering
+    PLACEMARK_FILTER = {'tag': '{*}Placemark'}
+except ImportError:
+    from xml.etree import ElementTree as ET
+    PLACEMARK_FILTER = {}
+
+from coordinates_source import find_coordinates_block
+
+_WARNING_MARKER_RE = re.compile(r'\s*⚠️.*$')
+
+# One PORT_COORDINATES entry, e.g.  "MIAMI": {"lat": 25.761700, "lon": -80.191800},
+_format_coord_line = '    "{}": {{"lat": {:.6f}, "lon": {:.6f}}},'.format
+
+# Rough conversion: 1 degree of latitude ≈ 111 km
+KM_PER_DEGREE = 111
+
+
+def iter_placemarks(kml_file):
+    """
+    Stream (name_text, coordinates_text) for every Placemark in a KML file,
+    in document order; either may be None if the element is missing.
+
+    One iterparse pass: each Placemark is handled as soon as it closes and
+    then cleared, so the document never sits in memory as a whole.
+    """
+    # With lxml the parser itself only reports Placemarks (any namespace)
+    for _, elem in ET.iterparse(kml_file, events=('end',), **PLACEMARK_FILTER):
+        tag = elem.tag
+        if not tag.endswith('Placemark'):
+            continue
+        # '{http://www.opengis.net/kml/2.2}' or '' (some KML files don't use it)
+        ns = tag[:-len('Placemark')]
+        if ns and not ns.endswith('}'):
+            continue
+        
+        name_elem = elem.find(f'.//{ns}name')
+        coord_elem = elem.find(f'.//{ns}coordinates')
+        yield (name_elem.text if name_elem is not None else None,
+               coord_elem.text if coord_elem is not None else None)
+        elem.clear()
 
 
 def parse_kml_file(kml_file):
@@ -32,84 +80,56 @@ def parse_kml_file(kml_file):
     """
     print(f"📖 Reading KML file: {kml_file}")
     
+    coordinates = {}
+    skipped = []
+    placemark_count = 0
+    
     try:
-        tree = ET.parse(kml_file)
-        root = tree.getroot()
+        for name_text, coord_text in iter_placemarks(kml_file):
+            placemark_count += 1
+            
+            if not name_text:
+                continue
+            
+            # Remove any warning markers we added
+            name = _WARNING_MARKER_RE.sub('', name_text.strip()).strip()
+            
+            if not coord_text:
+                skipped.append(name)
+                continue
+            
+            # Parse coordinates (KML format is: lon,lat,altitude)
+            parts = coord_text.strip().split(',')
+            
+            if len(parts) < 2:
+                skipped.append(name)
+                continue
+            
+            try:
+                lon = float(parts[0])
+                lat = float(parts[1])
+            except ValueError:
+                skipped.append(name)
+                continue
+            
+            if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+                print(f"   ⚠️  Skipping '{name}': coordinates out of range (lat={lat}, lon={lon})")
+                skipped.append(name)
+                continue
+            
+            # Store coordinates
+            coordinates[name] = {
+                "lat": lat,
+                "lon": lon
+            }
     except Exception as e:
         print(f"❌ Error reading KML file: {e}")
         return None
     
-    # Handle KML namespace
-    namespace = {'kml': 'http://www.opengis.net/kml/2.2'}
-    
-    # Try with namespace
-    placemarks = root.findall('.//kml:Placemark', namespace)
-    
-    # If no results, try without namespace (some KML files don't use it)
-    if not placemarks:
-        # Remove namespace from tag names
-        for elem in root.iter():
-            if '}' in elem.tag:
-                elem.tag = elem.tag.split('}')[1]
-        placemarks = root.findall('.//Placemark')
-    
-    if not placemarks:
+    if not placemark_count:
         print("❌ No placemarks found in KML file!")
         return None
     
-    coordinates = {}
-    skipped = []
-    
-    for placemark in placemarks:
-        # Get name
-        name_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}name')
-        if name_elem is None:
-            name_elem = placemark.find('.//name')
-        
-        if name_elem is None or not name_elem.text:
-            continue
-        
-        name = name_elem.text.strip()
-        
-        # Remove any warning markers we added
-        name = re.sub(r'\s*⚠️.*$', '', name)
-        name = name.strip()
-        
-        # Get coordinates
-        coord_elem = placemark.find('.//{http://www.opengis.net/kml/2.2}coordinates')
-        if coord_elem is None:
-            coord_elem = placemark.find('.//coordinates')
-        
-        if coord_elem is None or not coord_elem.text:
-            skipped.append(name)
-            continue
-        
-        # Parse coordinates (KML format is: lon,lat,altitude)
-        coord_text = coord_elem.text.strip()
-        parts = coord_text.split(',')
-        
-        if len(parts) < 2:
-            skipped.append(name)
-            continue
-        
-        try:
-            lon = float(parts[0])
-            lat = float(parts[1])
-        except ValueError:
-            skipped.append(name)
-            continue
-
-        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
-            print(f"   ⚠️  Skipping '{name}': coordinates out of range (lat={lat}, lon={lon})")
-            skipped.append(name)
-            continue
-
-        # Store coordinates
-        coordinates[name] = {
-            "lat": lat,
-            "lon": lon
-        }
-    
     print(f"✅ Found {len(coordinates)} ports with coordinates")
     
     if skipped:
@@ -118,9 +138,24 @@ def parse_kml_file(kml_file):
     return coordinates
 
 
-def update_scraper_with_coordinates(coordinates, dry_run=False):
+def load_scraper_source():
+    """
+    Read scraper.py once for both the comparison and the update.
+    Returns (source, PORT_COORDINATES span or None), or (None, None) if
+    scraper.py doesn't exist.
+    """
+    try:
+        with open('scraper.py', 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None, None
+    return content, find_coordinates_block(content)
+
+
+def update_scraper_with_coordinates(coordinates, content=None, span=None, dry_run=False):
     """
     Update scraper.py PORT_COORDINATES with the new coordinates.
+    content/span come from load_scraper_source() (not needed for dry runs).
     """
     if dry_run:
         print()
@@ -129,7 +164,7 @@ def update_scraper_with_coordinates(coordinates, dry_run=False):
         print("=" * 70)
         print()
         print("First 10 ports that would be updated:")
-        for i, (name, coords) in enumerate(list(coordinates.items())[:10]):
+        for name, coords in islice(coordinates.items(), 10):
             print(f'  "{name}": {{"lat": {coords["lat"]:.6f}, "lon": {coords["lon"]:.6f}}}')
         if len(coordinates) > 10:
             print(f"  ... and {len(coordinates) - 10} more")
@@ -142,45 +177,52 @@ def update_scraper_with_coordinates(coordinates, dry_run=False):
     print("📝 UPDATING scraper.py")
     print("=" * 70)
     
-    # Read current scraper.py
-    try:
-        with open('scraper.py', 'r') as f:
-            content = f.read()
-    except FileNotFoundError:
+    if content is None:
         print("❌ Error: scraper.py not found!")
         print("   Make sure you're running this from your project root folder.")
         return False
     
     # Build the new PORT_COORDINATES dictionary
-    coord_lines = ["PORT_COORDINATES = {"]
-    for port_name in sorted(coordinates.keys()):
-        coord = coordinates[port_name]
-        coord_lines.append(f'    "{port_name}": {{"lat": {coord["lat"]:.6f}, "lon": {coord["lon"]:.6f}}},')
-    coord_lines.append("}")
-    
-    new_coords_section = "\n".join(coord_lines)
+    new_coords_section = "\n".join([
+        "PORT_COORDINATES = {",
+        *(_format_coord_line(port_name, coord["lat"], coord["lon"])
+          for port_name, coord in sorted(coordinates.items())),
+        "}",
+    ])
     
-    # Find and replace the PORT_COORDINATES dictionary
-    pattern = r'PORT_COORDINATES\s*=\s*\{[^}]*\}'
-    
-    if re.search(pattern, content, re.DOTALL):
+    # Replace the PORT_COORDINATES dictionary at its brace-matched span, so
+    # the nested {"lat": .., "lon": ..} entries don't end the match early
+    if span:
         # Replace existing
-        updated_content = re.sub(pattern, new_coords_section, content, flags=re.DOTALL)
+        start, end = span
+        if content[start:end] == new_coords_section:
+            # Same block as on disk: skip the backup and the rewrite
+            print("✅ PORT_COORDINATES in scraper.py is already up to date")
+            print()
+            return True
+        updated_content = content[:start] + new_coords_section + content[end:]
         action = "Updated"
     else:
         # Append to end of file
         updated_content = content + "\n\n# Imported port coordinates from KML\n" + new_coords_section + "\n"
         action = "Added"
     
-    # Backup original
+    # Backup original (file-level copy; no need to re-write the text we read)
     backup_file = 'scraper.py.backup'
-    with open(backup_file, 'w') as f:
-        f.write(content)
+    shutil.copy2('scraper.py', backup_file)
     print(f"💾 Created backup: {backup_file}")
     
-    # Write updated file
-    with open('scraper.py', 'w') as f:
-        f.write(updated_content)
+    # Write updated file to a temp file, then swap it in atomically so a
+    # crash never leaves a half-written scraper.py
+    fd, tmp_path = tempfile.mkstemp(dir='.', prefix='.scraper.', suffix='.py')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(updated_content)
+        shutil.copymode('scraper.py', tmp_path)
+        os.replace(tmp_path, 'scraper.py')
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
     
     print(f"✅ {action} PORT_COORDINATES in scraper.py")
     print(f"📊 Updated {len(coordinates)} port coordinates")
@@ -189,38 +231,30 @@ def update_scraper_with_coordinates(coordinates, dry_run=False):
     return True
 
 
-def compare_with_existing(kml_coordinates):
+def compare_with_existing(kml_coordinates, content, span):
     """
     Compare KML coordinates with existing scraper.py coordinates.
-    Shows what changed.
+    Shows what changed. content/span come from load_scraper_source().
     """
     print()
     print("=" * 70)
     print("🔍 COMPARING WITH EXISTING COORDINATES")
     print("=" * 70)
     
+    if content is None:
+        print("⚠️  Could not compare: scraper.py not found")
+        return
+    
     # Try to load existing coordinates
     try:
-        with open('scraper.py', 'r') as f:
-            content = f.read()
-        
-        pattern = r'PORT_COORDINATES\s*=\s*\{([^}]+)\}'
-        match = re.search(pattern, content, re.DOTALL)
-        
-        if not match:
+        if not span:
             print("ℹ️  No existing PORT_COORDINATES found in scraper.py")
             print("   All coordinates will be new")
             return
         
-        coords_text = match.group(1)
-        existing = {}
-        
-        line_pattern = r'"([^"]+)":\s*\{\s*"lat":\s*([-\d.]+),\s*"lon":\s*([-\d.]+)'
-        for m in re.finditer(line_pattern, coords_text):
-            port_name = m.group(1)
-            lat = float(m.group(2))
-            lon = float(m.group(3))
-            existing[port_name] = {"lat": lat, "lon": lon}
+        # Evaluate just the dict literal (right of the '=')
+        start, end = span
+        existing = ast.literal_eval(content[content.index('{', start):end])
         
         # Compare
         new_ports = []
@@ -264,9 +298,8 @@ def compare_with_existing(kml_coordinates):
         if updated_ports:
             print()
             print(f"✏️  UPDATED PORTS (showing significant moves):")
-            # Sort by distance moved
-            updated_ports.sort(key=lambda x: x['distance_km'], reverse=True)
-            for item in updated_ports[:15]:
+            # Largest moves first; only the shown ones need ordering
+            for item in heapq.nlargest(15, updated_ports, key=itemgetter('distance_km')):
                 name = item['name']
                 old = item['old']
                 new = item['new']
@@ -289,17 +322,14 @@ def calculate_distance(coord1, coord2):
     Calculate approximate distance between two coordinates in kilometers.
     Uses simple Euclidean approximation (good enough for our purposes).
     """
-    lat_diff = coord2['lat'] - coord1['lat']
-    lon_diff = coord2['lon'] - coord1['lon']
+    lat1, lon1 = coord1['lat'], coord1['lon']
+    lat2, lon2 = coord2['lat'], coord2['lon']
     
-    # Rough conversion: 1 degree ≈ 111 km
     # Adjust longitude by latitude
-    avg_lat = (coord1['lat'] + coord2['lat']) / 2
-    lon_km = lon_diff * 111 * math.cos(math.radians(avg_lat))
-    lat_km = lat_diff * 111
+    lon_km = (lon2 - lon1) * KM_PER_DEGREE * math.cos(math.radians((lat1 + lat2) / 2))
+    lat_km = (lat2 - lat1) * KM_PER_DEGREE
     
-    distance = math.sqrt(lon_km**2 + lat_km**2)
-    return distance
+    return math.hypot(lon_km, lat_km)
 
 
 def main():
@@ -335,9 +365,12 @@ def main():
         print("❌ No coordinates found in KML file")
         return
     
-    # Compare with existing if requested
+    # Compare with existing if requested (scraper.py is read once here and
+    # reused by the update below)
+    scraper_src = block_span = None
     if args.compare or not args.dry_run:
-        compare_with_existing(coordinates)
+        scraper_src, block_span = load_scraper_source()
+        compare_with_existing(coordinates, scraper_src, block_span)
     
     # Update scraper.py
     if args.dry_run:
@@ -346,7 +379,7 @@ def main():
         print()
         response = input("Update scraper.py with these coordinates? (yes/no): ")
         if response.lower() in ['yes', 'y']:
-            success = update_scraper_with_coordinates(coordinates, dry_run=False)
+            success = update_scraper_with_coordinates(coordinates, scraper_src, block_span)
             
             if success:
                 print()
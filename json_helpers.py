@@ -0,0 +1,28 @@
+"""
+JSON loading shared by the command-line tools.
+
+json_loads is orjson's when it is installed, else the stdlib's; ijson is
+None when it isn't installed. iter_features streams a GeoJSON
+FeatureCollection with whichever of the two is available.
+"""
+
+try:
+    import ijson        # optional: streams features instead of loading the whole file
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import loads as json_loads      # optional: faster, parses bytes directly
+except ImportError:
+    from json import loads as json_loads
+
+
+def iter_features(f):
+    """Yield (properties, coordinates) for each feature in binary file f, closing f when done."""
+    with f:
+        if ijson is not None:
+            features = ijson.items(f, 'features.item', use_float=True)
+        else:
+            features = json_loads(f.read())['features']
+        for feature in features:
+            yield feature['properties'], feature['geometry']['coordinates']
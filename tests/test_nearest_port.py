@@ -0,0 +1,101 @@
+"""
+scraper.nearest_port / distances_km / port_coordinates over the PORT_COORDINATES table.
+
+Run with:  python -m unittest discover tests   (or pytest)
+"""
+
+import math
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scraper
+
+GEOCODED = [i for i, has in enumerate(scraper.PORT_HAS_COORD) if has]
+PLACEHOLDERS = [i for i, has in enumerate(scraper.PORT_HAS_COORD) if not has]
+
+
+def position(name):
+    """(lat, lon) of a PORT_NAMES entry, straight from the table."""
+    i = scraper.PORT_INDEX[name.upper()]
+    return scraper.PORT_LAT[i], scraper.PORT_LON[i]
+
+
+class NearestPortBehaviour(unittest.TestCase):
+
+    def test_own_position_returns_that_port(self):
+        for i in GEOCODED:
+            name = scraper.PORT_NAMES[i]
+            with self.subTest(name):
+                found = scraper.nearest_port(scraper.PORT_LAT[i], scraper.PORT_LON[i])
+                # Ports sharing a position may return each other
+                self.assertEqual(position(found), position(name))
+
+    def test_placeholders_never_returned(self):
+        self.assertTrue(PLACEHOLDERS, "table has no (0, 0) placeholders to check")
+        placeholder_names = {scraper.PORT_NAMES[i] for i in PLACEHOLDERS}
+        for lat, lon in ((0.0, 0.0), (0.5, -0.5), (-1.0, 1.0)):
+            with self.subTest(lat=lat, lon=lon):
+                self.assertNotIn(scraper.nearest_port(lat, lon), placeholder_names)
+
+    def test_placeholders_have_no_coordinates(self):
+        dist = scraper.distances_km(0.0, 0.0)
+        for i in PLACEHOLDERS:
+            name = scraper.PORT_NAMES[i]
+            with self.subTest(name):
+                self.assertIsNone(scraper.port_coordinates(name))
+                self.assertTrue(math.isnan(dist[i]))
+
+    def test_port_coordinates_ignores_case(self):
+        name = scraper.PORT_NAMES[GEOCODED[0]]
+        self.assertEqual(scraper.port_coordinates(name.lower()), position(name))
+        self.assertIsNone(scraper.port_coordinates("NO SUCH PORT"))
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Plain haversine, independent of the table's precomputed columns."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * scraper.EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def brute_force_km(lat, lon):
+    """Distance from (lat, lon) to the closest geocoded port, scanning every row."""
+    return min(haversine_km(lat, lon, scraper.PORT_LAT[i], scraper.PORT_LON[i])
+               for i in GEOCODED)
+
+
+def query_points():
+    """Random points, points just off each port, and the grid's awkward spots."""
+    rng = random.Random(20260203)
+    for _ in range(2000):
+        # Uniform on the sphere, not in lat/lon
+        yield math.degrees(math.asin(rng.uniform(-1, 1))), rng.uniform(-180, 180)
+    for i in GEOCODED:
+        for _ in range(3):
+            yield (scraper.PORT_LAT[i] + rng.uniform(-1.5, 1.5),
+                   scraper.PORT_LON[i] + rng.uniform(-1.5, 1.5))
+    for lat in (-90.0, -89.9, -45.0, 0.0, 29.0, 29.999, 41.0, 89.9, 90.0):
+        for lon in (-180.0, -179.9, -90.0, -80.0, -80.001, 0.0, 120.5, 179.9, 180.0):
+            yield lat, lon
+
+
+class NearestPortMatchesBruteForce(unittest.TestCase):
+    """The PORT_GRID pruning in nearest_port must never change the answer."""
+
+    def test_matches_full_scan(self):
+        for lat, lon in query_points():
+            with self.subTest(lat=lat, lon=lon):
+                found = scraper.nearest_port(lat, lon)
+                self.assertIsNotNone(found)
+                # Compare distances, so ties between ports don't matter
+                self.assertAlmostEqual(haversine_km(lat, lon, *position(found)),
+                                       brute_force_km(lat, lon), places=6)
+
+
+if __name__ == "__main__":
+    unittest.main()
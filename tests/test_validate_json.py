@@ -0,0 +1,105 @@
+"""
+validate_json.py gives the same verdict and report with and without ijson.
+
+Run with:  python -m unittest discover tests   (or pytest)
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import validate_json
+
+# Well-formed JSON with structural problems, plus a few that don't parse
+DOCUMENTS = {
+    "valid":             '{"type": "FeatureCollection", "features": [{"geometry": {}, "properties": {}}]}',
+    "non_object_features": '{"type": "FeatureCollection", "features": '
+                           '[{"geometry": 1}, "geometry", 5, null, true, [], ["properties"], '
+                           '{"properties": {"features": [1]}}]}',
+    "root_array":        '[{"type": "FeatureCollection"}]',
+    "missing_type":      '{"features": []}',
+    "type_is_object":    '{"type": {"a": 1, "b": [2.5]}, "features": []}',
+    "type_is_number":    '{"type": 5, "features": []}',
+    "type_after_features": '{"features": [{"geometry": null}], "type": "Feature"}',
+    "features_is_object": '{"type": "FeatureCollection", "features": {"item": {}}}',
+    "missing_features":  '{"type": "FeatureCollection"}',
+    "repeated_features": '{"type": "FeatureCollection", "features": [1, 2], "features": [{}]}',
+    "trailing_comma":    '{"type": "FeatureCollection",\n "features": [1,]}',
+    "truncated":         '{"type": "FeatureCollection", "features": [',
+    "blank":             ' \n ',
+}
+
+
+def run_validator(path, use_ijson):
+    """(return value, printed report) of validate_geojson on path."""
+    saved = validate_json.ijson
+    if not use_ijson:
+        validate_json.ijson = None
+    try:
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            ok = validate_json.validate_geojson(path)
+        return ok, out.getvalue()
+    finally:
+        validate_json.ijson = saved
+
+
+@unittest.skipIf(validate_json.ijson is None, "ijson not installed")
+class StreamAndParsePathsAgree(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmpdir.name, name + ".json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_same_report_with_and_without_ijson(self):
+        for name, text in DOCUMENTS.items():
+            with self.subTest(name):
+                path = self.write(name, text)
+                self.assertEqual(run_validator(path, use_ijson=True),
+                                 run_validator(path, use_ijson=False))
+
+    def test_non_object_features_reported_as_missing_keys(self):
+        path = self.write("non_object", DOCUMENTS["non_object_features"])
+        for use_ijson in (True, False):
+            with self.subTest(use_ijson=use_ijson):
+                ok, report = run_validator(path, use_ijson)
+                self.assertTrue(ok)
+                self.assertIn("Found 8 features", report)
+                for i in (1, 2, 3, 4, 5, 6):
+                    self.assertIn(f"Feature {i} missing 'geometry'", report)
+                    self.assertIn(f"Feature {i} missing 'properties'", report)
+
+    def test_object_type_reported_as_is(self):
+        path = self.write("type_obj", DOCUMENTS["type_is_object"])
+        for use_ijson in (True, False):
+            with self.subTest(use_ijson=use_ijson):
+                _, report = run_validator(path, use_ijson)
+                self.assertIn("Type is '{'a': 1, 'b': [2.5]}'", report)
+
+    def test_parse_errors_use_stdlib_report(self):
+        text = DOCUMENTS["trailing_comma"]
+        with self.assertRaises(json.JSONDecodeError) as ctx:
+            json.loads(text)
+        expected = f"Line {ctx.exception.lineno}, Column {ctx.exception.colno}\n   {ctx.exception.msg}\n"
+        path = self.write("trailing_comma", text)
+        for use_ijson in (True, False):
+            with self.subTest(use_ijson=use_ijson):
+                ok, report = run_validator(path, use_ijson)
+                self.assertFalse(ok)
+                self.assertIn(expected, report)
+
+
+if __name__ == "__main__":
+    unittest.main()
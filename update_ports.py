@@ -5,11 +5,32 @@ Main update script — orchestrates:
     3. Generate the two-layer GeoJSON that the map reads
 """
 
-import json, sys
+import json, logging, os, sys
+from collections import defaultdict
 from datetime import datetime, timezone
+from itertools import chain
 from database import PortStatusDB
 from scraper import NAVCENScraper, COTP_COORDINATES, worst_status
 
+try:
+    import orjson       # optional: faster, serializes straight to UTF-8 bytes
+except ImportError:
+    orjson = None
+
+GEOJSON_PATH = "api/ports.geojson"
+
+# The map gets compact JSON; PORTSTATUS_PRETTY=1 writes it indented for reading by hand
+PRETTY_GEOJSON = bool(os.environ.get("PORTSTATUS_PRETTY"))
+
+
+def dump_feature(feature, pretty: bool = False) -> bytes:
+    """One feature as UTF-8 JSON, compact or indent=2."""
+    if orjson is not None:
+        return orjson.dumps(feature, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(feature, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(feature, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 # ---------------------------------------------------------------------------
 # GeoJSON generator
@@ -33,39 +54,57 @@ def generate_geojson():
         all_subs  = db.get_all_subports()
 
     # ----- group sub-ports by zone_id for quick lookup -----
-    subs_by_zone: dict = {}
+    subs_by_zone = defaultdict(list)
     for sp in all_subs:
-        subs_by_zone.setdefault(sp["zone_id"], []).append(sp)
+        subs_by_zone[sp["zone_id"]].append(sp)
+
+    # Features are built and written one at a time; write to a temp file and
+    # swap it in so the map never reads a half-written file
+    os.makedirs("api", exist_ok=True)
+    tmp_path = GEOJSON_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write_feature_collection(f, chain(zone_features(zones, subs_by_zone, now_utc),
+                                          subport_features(all_subs, now_utc)),
+                                 pretty=PRETTY_GEOJSON)
+    os.replace(tmp_path, GEOJSON_PATH)
 
-    features = []
+    print(f"✅ Generated {GEOJSON_PATH} — {len(zones)} zones, {len(all_subs)} sub-ports")
 
-    # ----- COTP zone features -----
+
+def zone_features(zones, subs_by_zone, now_utc):
+    """Yield one cotp_zone feature per zone."""
     for z in zones:
         zone_id   = z["zone_id"]
         sub_list  = subs_by_zone.get(zone_id, [])
 
-        # Derive zone condition = worst of all sub-ports (fall back to recorded zone_condition)
-        sub_statuses = [sp["condition"] for sp in sub_list if sp.get("condition")]
-        if sub_statuses:
-            zone_condition = worst_status(sub_statuses)
-        else:
-            zone_condition = z.get("zone_condition") or "NORMAL"
-
-        # Find the most recent sub-port update time for "last updated"
-        sub_timestamps = [sp["recorded_at"] for sp in sub_list if sp.get("recorded_at")]
-        last_updated = max(sub_timestamps) if sub_timestamps else (z.get("recorded_at") or now_utc)
-
-        # Embed a summary of sub-ports so the popup can show them without a second fetch
-        sub_summary = []
+        # One pass over the sub-ports: their statuses, the most recent update
+        # time, and a summary to embed so the popup can show them without a
+        # second fetch
+        sub_statuses = []
+        last_updated = ""
+        sub_summary  = []
         for sp in sub_list:
+            condition   = sp.get("condition")
+            recorded_at = sp.get("recorded_at")
+            if condition:
+                sub_statuses.append(condition)
+            if recorded_at and recorded_at > last_updated:
+                last_updated = recorded_at
             sub_summary.append({
                 "name":         sp["port_name"],
-                "condition":    sp.get("condition") or "NORMAL",
+                "condition":    condition or "NORMAL",
                 "comments":     sp.get("comments") or "",
                 "last_changed": sp.get("last_changed") or "",
             })
 
-        features.append({
+        # Zone condition = worst of all sub-ports (fall back to recorded zone_condition)
+        if sub_statuses:
+            zone_condition = worst_status(sub_statuses)
+        else:
+            zone_condition = z.get("zone_condition") or "NORMAL"
+        last_updated = last_updated or z.get("recorded_at") or now_utc
+
+        yield {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
@@ -82,11 +121,13 @@ def generate_geojson():
                 "nextUpdate":    "",          # filled by frontend based on scrape schedule
                 "sub_ports":     sub_summary
             }
-        })
+        }
+
 
-    # ----- Sub-port features -----
+def subport_features(all_subs, now_utc):
+    """Yield one sub_port feature per sub-port."""
     for sp in all_subs:
-        features.append({
+        yield {
             "type": "Feature",
             "geometry": {
                 "type": "Point",
@@ -102,18 +143,32 @@ def generate_geojson():
                 "lastUpdated":   sp.get("recorded_at") or now_utc,
                 "nextUpdate":    ""
             }
-        })
+        }
 
-    geojson = {"type": "FeatureCollection", "features": features}
 
-    import os
-    os.makedirs("api", exist_ok=True)
-    with open("api/ports.geojson", "w", encoding="utf-8") as f:
-        json.dump(geojson, f, indent=2, ensure_ascii=False)
+def write_feature_collection(f, features, pretty: bool = False):
+    """
+    Write a FeatureCollection to binary file f one feature at a time, as
+    UTF-8 JSON. pretty=True gives the same layout as json.dump(..., indent=2).
+    """
+    if not pretty:
+        f.write(b'{"type":"FeatureCollection","features":[')
+        sep = b""
+        for feature in features:
+            f.write(sep)
+            f.write(dump_feature(feature))
+            sep = b","
+        f.write(b"]}")
+        return
 
-    zone_count = len([f for f in features if f["properties"]["type"] == "cotp_zone"])
-    sub_count  = len([f for f in features if f["properties"]["type"] == "sub_port"])
-    print(f"✅ Generated api/ports.geojson — {zone_count} zones, {sub_count} sub-ports")
+    f.write(b'{\n  "type": "FeatureCollection",\n  "features": [')
+    sep = b"\n    "
+    for feature in features:
+        f.write(sep)
+        # JSON strings never contain a raw newline, so re-indenting by line is safe
+        f.write(dump_feature(feature, pretty=True).replace(b"\n", b"\n    "))
+        sep = b",\n    "
+    f.write(b"]\n}" if sep == b"\n    " else b"\n  ]\n}")
 
 
 # ---------------------------------------------------------------------------
@@ -142,7 +197,9 @@ def update_ports():
 
     # 2 — store
     print("💾 Step 2: Updating database …")
-    with PortStatusDB() as db:
+    with PortStatusDB() as db, db.batch():
+        zone_records   = []
+        status_records = []
         for zd in zones_data:
             zone_name = zd["zone_name"]
             parent_coords = COTP_COORDINATES.get(zone_name, {"lat": 39.8283, "lon": -98.5795})
@@ -159,7 +216,7 @@ def update_ports():
             # Compute zone-level condition (worst sub-port) and record it
             sub_statuses = [sp["status"] for sp in zd["sub_ports"]]
             zone_cond    = worst_status(sub_statuses) if sub_statuses else "NORMAL"
-            db.record_zone_status(zone_id, zone_cond, zd.get("marsec_level", ""))
+            zone_records.append((zone_id, zone_cond, zd.get("marsec_level", "")))
 
             # Record each sub-port
             for sp in zd["sub_ports"]:
@@ -169,13 +226,17 @@ def update_ports():
                     lat       = sp["latitude"],
                     lon       = sp["longitude"],
                 )
-                db.record_subport_status(
-                    zone_id      = zone_id,
-                    subport_id   = subport_id,
-                    condition    = sp["status"],
-                    comments     = sp.get("comments", ""),
-                    last_changed = sp.get("last_changed", ""),
-                )
+                status_records.append((
+                    zone_id,
+                    subport_id,
+                    sp["status"],
+                    sp.get("comments", ""),
+                    sp.get("last_changed", ""),
+                ))
+
+        # All status snapshots in one go (zone rows first, as before)
+        db.record_zone_statuses(zone_records)
+        db.record_subport_statuses(status_records)
 
     print("✅ Database updated\n")
 
@@ -245,7 +306,7 @@ def test_update():
         },
     ]
 
-    with PortStatusDB() as db:
+    with PortStatusDB() as db, db.batch():
         for zd in fake_zones:
             zone_name = zd["zone_name"]
             parent_coords = COTP_COORDINATES.get(zone_name, {"lat": 39.8283, "lon": -98.5795})
@@ -265,6 +326,7 @@ def test_update():
 
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)   # scraper progress
     if "--test" in sys.argv:
         test_update()
     else:
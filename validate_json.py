@@ -8,54 +8,159 @@ and tell you exactly where the problem is if it's not.
 import json
 import sys
 
+from json_helpers import ijson, json_loads
+
+REQUIRED_FEATURE_KEYS = ('geometry', 'properties')
+_MISSING = object()
+
+
+def is_blank(f):
+    """True if binary file f holds nothing but whitespace."""
+    for chunk in iter(lambda: f.read(65536), b''):
+        if chunk.strip():
+            return False
+    return True
+
+
+def summarize(data):
+    """
+    Structure summary of a parsed document: whether the root is an object,
+    its 'type', whether 'features' is present and a list, the feature count,
+    and (index, key) for every feature missing a required key.
+    """
+    if not isinstance(data, dict):
+        return {'root_is_object': False}
+    features = data.get('features', _MISSING)
+    summary = {
+        'root_is_object': True,
+        'type': data.get('type', _MISSING),
+        'has_features': features is not _MISSING,
+        'features_is_list': isinstance(features, list),
+        'feature_count': 0,
+        'missing': [],
+    }
+    if summary['features_is_list']:
+        summary['feature_count'] = len(features)
+        # a feature that isn't an object has none of the required keys
+        summary['missing'] = [(i, key) for i, feature in enumerate(features)
+                              for key in REQUIRED_FEATURE_KEYS
+                              if not isinstance(feature, dict) or key not in feature]
+    return summary
+
+
+def summarize_events(events):
+    """Same summary as summarize(), from ijson parse events, one feature in memory at a time."""
+    _, event, _ = next(events)
+    if event != 'start_map':
+        for _ in events:                # still read to the end so syntax errors surface
+            pass
+        return {'root_is_object': False}
+
+    summary = {
+        'root_is_object': True,
+        'type': _MISSING,
+        'has_features': False,
+        'features_is_list': False,
+        'feature_count': 0,
+        'missing': [],
+    }
+    keys = None
+    type_builder = None                 # collects a non-scalar 'type' value
+    for prefix, event, value in events:
+        if type_builder is not None:
+            type_builder.event(event, value)
+            if prefix == 'type' and event in ('end_map', 'end_array'):
+                summary['type'] = type_builder.value
+                type_builder = None
+        elif prefix == 'features.item':
+            if event == 'start_map':
+                keys = set()
+            elif event == 'map_key':
+                keys.add(value)
+            elif event in ('end_map', 'start_array', 'string', 'number', 'boolean', 'null'):
+                # a non-object feature has none of the required keys
+                found = keys if event == 'end_map' else ()
+                i = summary['feature_count']
+                summary['missing'] += [(i, key) for key in REQUIRED_FEATURE_KEYS if key not in found]
+                summary['feature_count'] += 1
+        elif prefix == '' and event == 'map_key' and value == 'features':
+            summary['has_features'] = True
+        elif prefix == 'features' and event in ('start_array', 'start_map', 'string',
+                                                'number', 'boolean', 'null'):
+            # (a repeated key replaces the earlier value, as in json.loads)
+            summary['features_is_list'] = event == 'start_array'
+            summary['feature_count'] = 0
+            summary['missing'] = []
+        elif prefix == 'type' and event in ('start_map', 'start_array'):
+            type_builder = ijson.ObjectBuilder()
+            type_builder.event(event, value)
+        elif prefix == 'type' and event != 'map_key':
+            summary['type'] = value
+    return summary
+
+
 def validate_geojson(filepath):
     """Validate a GeoJSON file and provide helpful error messages."""
     print(f"🔍 Checking: {filepath}")
     print("-" * 50)
     
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Check if file is empty
-        if not content.strip():
-            print("❌ ERROR: File is empty!")
-            return False
+        with open(filepath, 'rb') as f:
+            # Check if file is empty
+            if is_blank(f):
+                print("❌ ERROR: File is empty!")
+                return False
+            f.seek(0)
             
-        # Try to parse JSON
-        data = json.loads(content)
+            # Stream the structure checks when ijson is available; on a
+            # syntax error, re-parse below for the line/column report
+            summary = None
+            if ijson is not None:
+                try:
+                    summary = summarize_events(ijson.parse(f, use_float=True))
+                except ijson.JSONError:
+                    f.seek(0)
+            if summary is None:
+                content = f.read()
+                try:
+                    data = json_loads(content)
+                except ValueError:
+                    if json_loads is json.loads:
+                        raise
+                    # orjson's errors are terse; stdlib json gives the
+                    # line/column report below (and accepts e.g. NaN)
+                    data = json.loads(content)
+                summary = summarize(data)
         
         # Check if it's valid GeoJSON structure
-        if not isinstance(data, dict):
+        if not summary['root_is_object']:
             print("❌ ERROR: Root element should be an object ({})")
             return False
             
-        if 'type' not in data:
+        if summary['type'] is _MISSING:
             print("⚠️  WARNING: Missing 'type' field (should be 'FeatureCollection')")
             
-        if data.get('type') != 'FeatureCollection':
-            print(f"⚠️  WARNING: Type is '{data.get('type')}' but should be 'FeatureCollection'")
+        if summary['type'] != 'FeatureCollection':
+            doc_type = None if summary['type'] is _MISSING else summary['type']
+            print(f"⚠️  WARNING: Type is '{doc_type}' but should be 'FeatureCollection'")
             
-        if 'features' not in data:
+        if not summary['has_features']:
             print("❌ ERROR: Missing 'features' array")
             return False
             
-        if not isinstance(data['features'], list):
+        if not summary['features_is_list']:
             print("❌ ERROR: 'features' should be an array")
             return False
             
         # Validate features
-        feature_count = len(data['features'])
+        feature_count = summary['feature_count']
         print(f"✅ Valid JSON!")
         print(f"✅ Valid GeoJSON structure!")
         print(f"📊 Found {feature_count} features")
         
         # Check for common issues
-        for i, feature in enumerate(data['features']):
-            if 'geometry' not in feature:
-                print(f"⚠️  WARNING: Feature {i} missing 'geometry'")
-            if 'properties' not in feature:
-                print(f"⚠️  WARNING: Feature {i} missing 'properties'")
+        for i, key in summary['missing']:
+            print(f"⚠️  WARNING: Feature {i} missing '{key}'")
                 
         print("-" * 50)
         print("✅ File is valid and ready to use!")